@@ -45,8 +45,8 @@ def invoke_duckdb_function(
 
     return call_duckdb_function(
         signatures,
-        return_category=return_category,
-        operands=operands,
+        return_category,
+        operands,
         order_by=order_by,
         within_group=within_group,
         partition_by=partition_by,
@@ -72,8 +72,8 @@ def invoke_duckdb_filter_function(
     return call_duckdb_filter_function(
         predicate,
         signatures,
-        return_category=return_category,
-        operands=operands,
+        return_category,
+        operands,
         order_by=order_by,
         within_group=within_group,
         partition_by=partition_by,
@@ -9,8 +9,16 @@ from duckplus.functions._base import (
     register_duckdb_function,
 )
 from duckplus.static_typed.expression import GenericExpression
-from duckplus.static_typed.functions import DuckDBFunctionDefinition
-from duckplus.static_typed.types import parse_type
+from duckplus.static_typed.function_overrides.scalar_generic import (
+    _ARRAY_APPEND_SIGNATURES,
+    _ARRAY_INTERSECT_SIGNATURES,
+    _ARRAY_POP_BACK_SIGNATURES,
+    _ARRAY_POP_FRONT_SIGNATURES,
+    _ARRAY_PREPEND_SIGNATURES,
+    _ARRAY_PUSH_BACK_SIGNATURES,
+    _ARRAY_PUSH_FRONT_SIGNATURES,
+    _ARRAY_REVERSE_SIGNATURES,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     from duckplus.static_typed._generated_function_namespaces import (
@@ -18,22 +26,6 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     )
 
 
-_ARRAY_APPEND_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_append",
-        function_type="scalar",
-        return_type=parse_type('"NULL"[]'),
-        parameter_types=(None, None),
-        parameters=("arr", "el"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_append(arr, el)",
-    ),
-)
-
-
 @register_duckdb_function("array_append")
 def array_append(
     self: "ScalarGenericFunctions",
@@ -51,22 +43,6 @@ def array_append(
     )
 
 
-_ARRAY_INTERSECT_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_intersect",
-        function_type="scalar",
-        return_type=parse_type('"NULL"'),
-        parameter_types=(None, None),
-        parameters=("l1", "l2"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_intersect(l1, l2)",
-    ),
-)
-
-
 @register_duckdb_function("array_intersect")
 def array_intersect(
     self: "ScalarGenericFunctions",
@@ -84,22 +60,6 @@ def array_intersect(
     )
 
 
-_ARRAY_POP_BACK_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_pop_back",
-        function_type="scalar",
-        return_type=parse_type('"NULL"'),
-        parameter_types=(None,),
-        parameters=("arr",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="arr[:(len(arr) - 1)]",
-    ),
-)
-
-
 @register_duckdb_function("array_pop_back")
 def array_pop_back(
     self: "ScalarGenericFunctions",
@@ -117,22 +77,6 @@ def array_pop_back(
     )
 
 
-_ARRAY_POP_FRONT_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_pop_front",
-        function_type="scalar",
-        return_type=parse_type('"NULL"'),
-        parameter_types=(None,),
-        parameters=("arr",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="arr[2:]",
-    ),
-)
-
-
 @register_duckdb_function("array_pop_front")
 def array_pop_front(
     self: "ScalarGenericFunctions",
@@ -150,22 +94,6 @@ def array_pop_front(
     )
 
 
-_ARRAY_PREPEND_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_prepend",
-        function_type="scalar",
-        return_type=parse_type('"NULL"[]'),
-        parameter_types=(None, None),
-        parameters=("el", "arr"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_prepend(el, arr)",
-    ),
-)
-
-
 @register_duckdb_function("array_prepend")
 def array_prepend(
     self: "ScalarGenericFunctions",
@@ -183,22 +111,6 @@ def array_prepend(
     )
 
 
-_ARRAY_PUSH_BACK_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_push_back",
-        function_type="scalar",
-        return_type=parse_type('"NULL"[]'),
-        parameter_types=(None, None),
-        parameters=("arr", "e"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_concat(arr, list_value(e))",
-    ),
-)
-
-
 @register_duckdb_function("array_push_back")
 def array_push_back(
     self: "ScalarGenericFunctions",
@@ -216,22 +128,6 @@ def array_push_back(
     )
 
 
-_ARRAY_PUSH_FRONT_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_push_front",
-        function_type="scalar",
-        return_type=parse_type('"NULL"[]'),
-        parameter_types=(None, None),
-        parameters=("arr", "e"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_concat(list_value(e), arr)",
-    ),
-)
-
-
 @register_duckdb_function("array_push_front")
 def array_push_front(
     self: "ScalarGenericFunctions",
@@ -249,22 +145,6 @@ def array_push_front(
     )
 
 
-_ARRAY_REVERSE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_reverse",
-        function_type="scalar",
-        return_type=parse_type('"NULL"'),
-        parameter_types=(None,),
-        parameters=("l",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_reverse(l)",
-    ),
-)
-
-
 @register_duckdb_function("array_reverse")
 def array_reverse(
     self: "ScalarGenericFunctions",
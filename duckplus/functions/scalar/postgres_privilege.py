@@ -9,8 +9,19 @@ from duckplus.functions._base import (
     register_duckdb_function,
 )
 from duckplus.static_typed.expression import BooleanExpression
-from duckplus.static_typed.functions import DuckDBFunctionDefinition
-from duckplus.static_typed.types import parse_type
+from duckplus.static_typed.function_overrides.scalar_postgres_privilege import (
+    _HAS_ANY_COLUMN_PRIVILEGE_SIGNATURES,
+    _HAS_COLUMN_PRIVILEGE_SIGNATURES,
+    _HAS_DATABASE_PRIVILEGE_SIGNATURES,
+    _HAS_FOREIGN_DATA_WRAPPER_PRIVILEGE_SIGNATURES,
+    _HAS_FUNCTION_PRIVILEGE_SIGNATURES,
+    _HAS_LANGUAGE_PRIVILEGE_SIGNATURES,
+    _HAS_SCHEMA_PRIVILEGE_SIGNATURES,
+    _HAS_SEQUENCE_PRIVILEGE_SIGNATURES,
+    _HAS_SERVER_PRIVILEGE_SIGNATURES,
+    _HAS_TABLESPACE_PRIVILEGE_SIGNATURES,
+    _HAS_TABLE_PRIVILEGE_SIGNATURES,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     from duckplus.static_typed._generated_function_namespaces import (
@@ -18,34 +29,6 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     )
 
 
-_HAS_ANY_COLUMN_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_any_column_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("table", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_any_column_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "table", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_any_column_privilege")
 def has_any_column_privilege(
     self: "ScalarBooleanFunctions",
@@ -68,34 +51,6 @@ def has_any_column_privilege(
     )
 
 
-_HAS_COLUMN_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_column_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("table", "column", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_column_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None, None),
-        parameters=("user", "table", "column", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_column_privilege")
 def has_column_privilege(
     self: "ScalarBooleanFunctions",
@@ -118,34 +73,6 @@ def has_column_privilege(
     )
 
 
-_HAS_DATABASE_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_database_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("database", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_database_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "database", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_database_privilege")
 def has_database_privilege(
     self: "ScalarBooleanFunctions",
@@ -168,36 +95,6 @@ def has_database_privilege(
     )
 
 
-_HAS_FOREIGN_DATA_WRAPPER_PRIVILEGE_SIGNATURES: tuple[
-    DuckDBFunctionDefinition, ...
-] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_foreign_data_wrapper_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("fdw", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_foreign_data_wrapper_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "fdw", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_foreign_data_wrapper_privilege")
 def has_foreign_data_wrapper_privilege(
     self: "ScalarBooleanFunctions",
@@ -220,34 +117,6 @@ def has_foreign_data_wrapper_privilege(
     )
 
 
-_HAS_FUNCTION_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_function_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("function", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_function_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "function", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_function_privilege")
 def has_function_privilege(
     self: "ScalarBooleanFunctions",
@@ -270,34 +139,6 @@ def has_function_privilege(
     )
 
 
-_HAS_LANGUAGE_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_language_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("language", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_language_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "language", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_language_privilege")
 def has_language_privilege(
     self: "ScalarBooleanFunctions",
@@ -320,34 +161,6 @@ def has_language_privilege(
     )
 
 
-_HAS_SCHEMA_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_schema_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("schema", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_schema_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "schema", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_schema_privilege")
 def has_schema_privilege(
     self: "ScalarBooleanFunctions",
@@ -370,34 +183,6 @@ def has_schema_privilege(
     )
 
 
-_HAS_SEQUENCE_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_sequence_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("sequence", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_sequence_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "sequence", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_sequence_privilege")
 def has_sequence_privilege(
     self: "ScalarBooleanFunctions",
@@ -420,34 +205,6 @@ def has_sequence_privilege(
     )
 
 
-_HAS_SERVER_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_server_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("server", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_server_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "server", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_server_privilege")
 def has_server_privilege(
     self: "ScalarBooleanFunctions",
@@ -470,34 +227,6 @@ def has_server_privilege(
     )
 
 
-_HAS_TABLE_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_table_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("table", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_table_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "table", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_table_privilege")
 def has_table_privilege(
     self: "ScalarBooleanFunctions",
@@ -520,34 +249,6 @@ def has_table_privilege(
     )
 
 
-_HAS_TABLESPACE_PRIVILEGE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_tablespace_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("tablespace", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="has_tablespace_privilege",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "tablespace", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("has_tablespace_privilege")
 def has_tablespace_privilege(
     self: "ScalarBooleanFunctions",
@@ -9,8 +9,21 @@ from duckplus.functions._base import (
     register_duckdb_function,
 )
 from duckplus.static_typed.expression import BooleanExpression
-from duckplus.static_typed.functions import DuckDBFunctionDefinition
-from duckplus.static_typed.types import parse_type
+from duckplus.static_typed.function_overrides.scalar_postgres_visibility import (
+    _PG_COLLATION_IS_VISIBLE_SIGNATURES,
+    _PG_CONVERSION_IS_VISIBLE_SIGNATURES,
+    _PG_FUNCTION_IS_VISIBLE_SIGNATURES,
+    _PG_HAS_ROLE_SIGNATURES,
+    _PG_OPCLASS_IS_VISIBLE_SIGNATURES,
+    _PG_OPERATOR_IS_VISIBLE_SIGNATURES,
+    _PG_OPFAMILY_IS_VISIBLE_SIGNATURES,
+    _PG_TABLE_IS_VISIBLE_SIGNATURES,
+    _PG_TS_CONFIG_IS_VISIBLE_SIGNATURES,
+    _PG_TS_DICT_IS_VISIBLE_SIGNATURES,
+    _PG_TS_PARSER_IS_VISIBLE_SIGNATURES,
+    _PG_TS_TEMPLATE_IS_VISIBLE_SIGNATURES,
+    _PG_TYPE_IS_VISIBLE_SIGNATURES,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     from duckplus.static_typed._generated_function_namespaces import (
@@ -18,22 +31,6 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     )
 
 
-_PG_COLLATION_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_collation_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("collation_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_collation_is_visible")
 def pg_collation_is_visible(
     self: "ScalarBooleanFunctions",
@@ -51,22 +48,6 @@ def pg_collation_is_visible(
     )
 
 
-_PG_CONVERSION_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_conversion_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("conversion_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_conversion_is_visible")
 def pg_conversion_is_visible(
     self: "ScalarBooleanFunctions",
@@ -84,22 +65,6 @@ def pg_conversion_is_visible(
     )
 
 
-_PG_FUNCTION_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_function_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("function_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_function_is_visible")
 def pg_function_is_visible(
     self: "ScalarBooleanFunctions",
@@ -117,34 +82,6 @@ def pg_function_is_visible(
     )
 
 
-_PG_HAS_ROLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_has_role",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None),
-        parameters=("role", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_has_role",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None, None, None),
-        parameters=("user", "role", "privilege"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_has_role")
 def pg_has_role(
     self: "ScalarBooleanFunctions",
@@ -162,22 +99,6 @@ def pg_has_role(
     )
 
 
-_PG_OPCLASS_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_opclass_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("opclass_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_opclass_is_visible")
 def pg_opclass_is_visible(
     self: "ScalarBooleanFunctions",
@@ -195,22 +116,6 @@ def pg_opclass_is_visible(
     )
 
 
-_PG_OPERATOR_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_operator_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("operator_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_operator_is_visible")
 def pg_operator_is_visible(
     self: "ScalarBooleanFunctions",
@@ -228,22 +133,6 @@ def pg_operator_is_visible(
     )
 
 
-_PG_OPFAMILY_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_opfamily_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("opclass_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_opfamily_is_visible")
 def pg_opfamily_is_visible(
     self: "ScalarBooleanFunctions",
@@ -261,22 +150,6 @@ def pg_opfamily_is_visible(
     )
 
 
-_PG_TABLE_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_table_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("table_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_table_is_visible")
 def pg_table_is_visible(
     self: "ScalarBooleanFunctions",
@@ -294,22 +167,6 @@ def pg_table_is_visible(
     )
 
 
-_PG_TS_CONFIG_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_ts_config_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("config_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_ts_config_is_visible")
 def pg_ts_config_is_visible(
     self: "ScalarBooleanFunctions",
@@ -327,22 +184,6 @@ def pg_ts_config_is_visible(
     )
 
 
-_PG_TS_DICT_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_ts_dict_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("dict_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_ts_dict_is_visible")
 def pg_ts_dict_is_visible(
     self: "ScalarBooleanFunctions",
@@ -360,22 +201,6 @@ def pg_ts_dict_is_visible(
     )
 
 
-_PG_TS_PARSER_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_ts_parser_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("parser_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_ts_parser_is_visible")
 def pg_ts_parser_is_visible(
     self: "ScalarBooleanFunctions",
@@ -393,22 +218,6 @@ def pg_ts_parser_is_visible(
     )
 
 
-_PG_TS_TEMPLATE_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_ts_template_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("template_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_ts_template_is_visible")
 def pg_ts_template_is_visible(
     self: "ScalarBooleanFunctions",
@@ -426,22 +235,6 @@ def pg_ts_template_is_visible(
     )
 
 
-_PG_TYPE_IS_VISIBLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_type_is_visible",
-        function_type="scalar",
-        return_type=parse_type("BOOLEAN"),
-        parameter_types=(None,),
-        parameters=("type_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="CAST('t' AS BOOLEAN)",
-    ),
-)
-
-
 @register_duckdb_function("pg_type_is_visible")
 def pg_type_is_visible(
     self: "ScalarBooleanFunctions",
@@ -9,8 +9,11 @@ from duckplus.functions._base import (
     register_duckdb_function,
 )
 from duckplus.static_typed.expression import VarcharExpression
-from duckplus.static_typed.functions import DuckDBFunctionDefinition
-from duckplus.static_typed.types import parse_type
+from duckplus.static_typed.function_overrides.scalar_string import (
+    _ARRAY_TO_STRING_COMMA_DEFAULT_SIGNATURES,
+    _ARRAY_TO_STRING_SIGNATURES,
+    _SPLIT_PART_SIGNATURES,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     from duckplus.static_typed._generated_function_namespaces import (
@@ -18,27 +21,6 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     )
 
 
-_SPLIT_PART_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="split_part",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None, None, None),
-        parameters=("string", "delimiter", "position"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition=(
-            "CASE  WHEN (((string IS NOT NULL) AND (\"delimiter\" IS NOT NULL) "
-            "AND (\"position\" IS NOT NULL))) "
-            "THEN (COALESCE(string_split(string, \"delimiter\")[\"position\"], '')) "
-            "ELSE NULL END"
-        ),
-    ),
-)
-
-
 @register_duckdb_function("split_part")
 def split_part(
     self: "ScalarVarcharFunctions",
@@ -60,22 +42,6 @@ def split_part(
     )
 
 
-_ARRAY_TO_STRING_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_to_string",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None, None),
-        parameters=("arr", "sep"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_aggr(CAST(arr AS VARCHAR[]), 'string_agg', sep)",
-    ),
-)
-
-
 @register_duckdb_function("array_to_string")
 def array_to_string(
     self: "ScalarVarcharFunctions",
@@ -97,22 +63,6 @@ def array_to_string(
     )
 
 
-_ARRAY_TO_STRING_COMMA_DEFAULT_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="array_to_string_comma_default",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None, None),
-        parameters=("arr", "sep"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="list_aggr(CAST(arr AS VARCHAR[]), 'string_agg', sep)",
-    ),
-)
-
-
 @register_duckdb_function("array_to_string_comma_default")
 def array_to_string_comma_default(
     self: "ScalarVarcharFunctions",
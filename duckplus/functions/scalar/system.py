@@ -9,8 +9,20 @@ from duckplus.functions._base import (
     register_duckdb_function,
 )
 from duckplus.static_typed.expression import VarcharExpression
-from duckplus.static_typed.functions import DuckDBFunctionDefinition
-from duckplus.static_typed.types import parse_type
+from duckplus.static_typed.function_overrides.scalar_system import (
+    _CURRENT_CATALOG_SIGNATURES,
+    _CURRENT_DATABASE_SIGNATURES,
+    _CURRENT_QUERY_SIGNATURES,
+    _CURRENT_ROLE_SIGNATURES,
+    _CURRENT_SCHEMAS_SIGNATURES,
+    _CURRENT_SCHEMA_SIGNATURES,
+    _CURRENT_USER_SIGNATURES,
+    _PG_GET_CONSTRAINTDEF_SIGNATURES,
+    _PG_GET_VIEWDEF_SIGNATURES,
+    _PG_SIZE_PRETTY_SIGNATURES,
+    _PG_TYPEOF_SIGNATURES,
+    _SESSION_USER_SIGNATURES,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     from duckplus.static_typed._generated_function_namespaces import (
@@ -18,26 +30,9 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard for type checkers
     )
 
 
-_CURRENT_CATALOG_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_catalog",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="main.current_database()",
-    ),
-)
-
-
 @register_duckdb_function("current_catalog")
 def current_catalog(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the catalog for the active connection."""
 
@@ -46,43 +41,14 @@ def current_catalog(
         invoke_duckdb_function(
             _CURRENT_CATALOG_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_CURRENT_DATABASE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_database",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description="Returns the name of the currently active database",
-        comment=None,
-        macro_definition=None,
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="current_database",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition='"system".main.current_database()',
-    ),
-)
-
-
 @register_duckdb_function("current_database")
 def current_database(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the active database name for the current session."""
 
@@ -91,43 +57,14 @@ def current_database(
         invoke_duckdb_function(
             _CURRENT_DATABASE_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_CURRENT_QUERY_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_query",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description="Returns the current query as a string",
-        comment=None,
-        macro_definition=None,
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="current_query",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition='"system".main.current_query()',
-    ),
-)
-
-
 @register_duckdb_function("current_query")
 def current_query(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the SQL text of the query currently executing."""
 
@@ -136,31 +73,14 @@ def current_query(
         invoke_duckdb_function(
             _CURRENT_QUERY_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_CURRENT_ROLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_role",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="'duckdb'",
-    ),
-)
-
-
 @register_duckdb_function("current_role")
 def current_role(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the active role (DuckDB always reports ``duckdb``)."""
 
@@ -169,43 +89,14 @@ def current_role(
         invoke_duckdb_function(
             _CURRENT_ROLE_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_CURRENT_SCHEMA_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_schema",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description="Returns the name of the currently active schema. Default is main",
-        comment=None,
-        macro_definition=None,
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="current_schema",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition='"system".main.current_schema()',
-    ),
-)
-
-
 @register_duckdb_function("current_schema")
 def current_schema(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the default schema for new relations."""
 
@@ -214,39 +105,11 @@ def current_schema(
         invoke_duckdb_function(
             _CURRENT_SCHEMA_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_CURRENT_SCHEMAS_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_schemas",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR[]"),
-        parameter_types=(parse_type("BOOLEAN"),),
-        parameters=("include_implicit",),
-        varargs=None,
-        description="Returns list of schemas. Pass a parameter of True to include implicit schemas",
-        comment=None,
-        macro_definition=None,
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="current_schemas",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR[]"),
-        parameter_types=(None,),
-        parameters=("include_implicit",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition='"system".main.current_schemas(include_implicit)',
-    ),
-)
-
-
 @register_duckdb_function("current_schemas")
 def current_schemas(
     self: "ScalarVarcharFunctions",
@@ -264,26 +127,9 @@ def current_schemas(
     )
 
 
-_CURRENT_USER_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="current_user",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="'duckdb'",
-    ),
-)
-
-
 @register_duckdb_function("current_user")
 def current_user(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the authenticated user (always ``duckdb``)."""
 
@@ -292,31 +138,14 @@ def current_user(
         invoke_duckdb_function(
             _CURRENT_USER_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_SESSION_USER_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="main",
-        function_name="session_user",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(),
-        parameters=(),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="'duckdb'",
-    ),
-)
-
-
 @register_duckdb_function("session_user")
 def session_user(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the session user (DuckDB always reports ``duckdb``)."""
 
@@ -325,43 +154,11 @@ def session_user(
         invoke_duckdb_function(
             _SESSION_USER_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
 
-_PG_GET_CONSTRAINTDEF_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_get_constraintdef",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None,),
-        parameters=("constraint_oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition=(
-            "(SELECT constraint_text FROM duckdb_constraints() AS d_constraint "
-            "WHERE ((d_constraint.table_oid = (constraint_oid // 1000000)) "
-            "AND (d_constraint.constraint_index = (constraint_oid % 1000000))))"
-        ),
-    ),
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_get_constraintdef",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None, None),
-        parameters=("constraint_oid", "pretty_bool"),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="pg_get_constraintdef(constraint_oid)",
-    ),
-)
-
-
 @register_duckdb_function("pg_get_constraintdef")
 def pg_get_constraintdef(
     self: "ScalarVarcharFunctions",
@@ -379,22 +176,6 @@ def pg_get_constraintdef(
     )
 
 
-_PG_GET_VIEWDEF_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_get_viewdef",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None,),
-        parameters=("oid",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition='(SELECT "sql" FROM duckdb_views() AS v WHERE (v.view_oid = oid))',
-    ),
-)
-
-
 @register_duckdb_function("pg_get_viewdef")
 def pg_get_viewdef(
     self: "ScalarVarcharFunctions",
@@ -412,22 +193,6 @@ def pg_get_viewdef(
     )
 
 
-_PG_SIZE_PRETTY_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_size_pretty",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None,),
-        parameters=("bytes",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="format_bytes(bytes)",
-    ),
-)
-
-
 @register_duckdb_function("pg_size_pretty")
 def pg_size_pretty(
     self: "ScalarVarcharFunctions",
@@ -445,22 +210,6 @@ def pg_size_pretty(
     )
 
 
-_PG_TYPEOF_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
-    DuckDBFunctionDefinition(
-        schema_name="pg_catalog",
-        function_name="pg_typeof",
-        function_type="scalar",
-        return_type=parse_type("VARCHAR"),
-        parameter_types=(None,),
-        parameters=("expression",),
-        varargs=None,
-        description=None,
-        comment=None,
-        macro_definition="lower(typeof(expression))",
-    ),
-)
-
-
 @register_duckdb_function("pg_typeof")
 def pg_typeof(
     self: "ScalarVarcharFunctions",
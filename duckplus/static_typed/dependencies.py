@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
 
@@ -78,15 +79,39 @@ def _coerce_dependency(value: DependencyLike) -> ExpressionDependency:
     raise TypeError(msg)
 
 
+# Literals and other dependency-free expressions all share this empty set.
+_NO_DEPENDENCIES: frozenset[ExpressionDependency] = frozenset()
+
+
+# Column references reuse a small vocabulary of names, so each one maps to a
+# single shared set instead of a fresh dependency and frozenset per reference.
+@lru_cache(maxsize=4096)
+def column_dependencies(
+    name: str,
+    *,
+    table: str | None = None,
+) -> frozenset[ExpressionDependency]:
+    """Return the normalised dependency set for a single column reference."""
+    return frozenset((ExpressionDependency.column(name, table=table),))
+
+
 def normalise_dependencies(
     dependencies: Iterable[DependencyLike],
 ) -> frozenset[ExpressionDependency]:
     """Convert arbitrary dependency inputs into a normalised frozenset."""
-    if isinstance(dependencies, frozenset) and all(
-        isinstance(value, ExpressionDependency) for value in dependencies
-    ):
-        return dependencies
+    if isinstance(dependencies, tuple) and not dependencies:
+        return _NO_DEPENDENCIES
+    if isinstance(dependencies, frozenset):
+        # Expressions pass their own normalised sets to each other, so this is
+        # the hot path; a plain loop avoids building a generator per call.
+        for value in dependencies:
+            if not isinstance(value, ExpressionDependency):
+                break
+        else:
+            return dependencies
     normalised: set[ExpressionDependency] = set()
     for dependency in dependencies:
         normalised.add(_coerce_dependency(dependency))
+    if not normalised:
+        return _NO_DEPENDENCIES
     return frozenset(normalised)
@@ -51,29 +51,31 @@ from .select import SelectStatementBuilder
 class DuckTypeNamespace:
     """Container exposing typed expression factories."""
 
+    # Factories are stateless, so every namespace shares the class-level ones.
+    __slots__ = ()
+
     _DECIMAL_FACTORY_NAMES: tuple[str, ...] = DECIMAL_FACTORY_NAMES
 
-    def __init__(self) -> None:
-        self.Numeric = NumericFactory()
-        self.Varchar = VarcharFactory()
-        self.Boolean = BooleanFactory()
-        self.Blob = BlobFactory()
-        self.Generic = GenericFactory()
-        self.Tinyint = NumericFactory(TinyintExpression)
-        self.Smallint = NumericFactory(SmallintExpression)
-        self.Integer = NumericFactory(IntegerExpression)
-        self.Utinyint = NumericFactory(UnsignedTinyintExpression)
-        self.Usmallint = NumericFactory(UnsignedSmallintExpression)
-        self.Uinteger = NumericFactory(UnsignedIntegerExpression)
-        self.Float = NumericFactory(FloatExpression)
-        self.Double = NumericFactory(DoubleExpression)
-        self.Date = TemporalFactory(DateExpression)
-        self.Timestamp = TemporalFactory(TimestampExpression)
-        self.Timestamp_s = TemporalFactory(TimestampSecondsExpression)
-        self.Timestamp_ms = TemporalFactory(TimestampMillisecondsExpression)
-        self.Timestamp_us = TemporalFactory(TimestampMicrosecondsExpression)
-        self.Timestamp_ns = TemporalFactory(TimestampNanosecondsExpression)
-        self.Timestamp_tz = TemporalFactory(TimestampWithTimezoneExpression)
+    Numeric = NumericFactory()
+    Varchar = VarcharFactory()
+    Boolean = BooleanFactory()
+    Blob = BlobFactory()
+    Generic = GenericFactory()
+    Tinyint = NumericFactory(TinyintExpression)
+    Smallint = NumericFactory(SmallintExpression)
+    Integer = NumericFactory(IntegerExpression)
+    Utinyint = NumericFactory(UnsignedTinyintExpression)
+    Usmallint = NumericFactory(UnsignedSmallintExpression)
+    Uinteger = NumericFactory(UnsignedIntegerExpression)
+    Float = NumericFactory(FloatExpression)
+    Double = NumericFactory(DoubleExpression)
+    Date = TemporalFactory(DateExpression)
+    Timestamp = TemporalFactory(TimestampExpression)
+    Timestamp_s = TemporalFactory(TimestampSecondsExpression)
+    Timestamp_ms = TemporalFactory(TimestampMillisecondsExpression)
+    Timestamp_us = TemporalFactory(TimestampMicrosecondsExpression)
+    Timestamp_ns = TemporalFactory(TimestampNanosecondsExpression)
+    Timestamp_tz = TemporalFactory(TimestampWithTimezoneExpression)
 
     def select(self) -> SelectStatementBuilder:
         return SelectStatementBuilder()
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Iterable, TypeVar, Union
 from ..dependencies import (
     DependencyLike,
     ExpressionDependency,
+    column_dependencies,
     normalise_dependencies,
 )
 from ..types import BooleanType, DuckDBType, GenericType
@@ -32,6 +33,16 @@ def _scalar_varchar_namespace():
 
     return SCALAR_FUNCTIONS.Varchar
 
+# Types carry no per-expression state, so default-typed expressions share these.
+_DEFAULT_BOOLEAN_TYPE = BooleanType("BOOLEAN")
+_DEFAULT_GENERIC_TYPE = GenericType("UNKNOWN")
+
+# Comparisons against plain literals are the common case; an exact-type set
+# lookup accepts them before the isinstance walk that admits subclasses.
+_SCALAR_OPERAND_TYPES: frozenset[type] = frozenset(
+    (str, int, float, bool, bytes, Decimal)
+)
+
 ExpressionT = TypeVar("ExpressionT", bound="TypedExpression")
 ComparisonResult = Union["BooleanExpression", NotImplementedType]
 
@@ -97,61 +108,61 @@ class TypedExpression:
     def _comparison(self: ExpressionT, operator: str, other: object) -> "BooleanExpression":
         operand = self._coerce_operand(other)
         sql = f"({self.render()} {operator} {operand.render()})"
-        dependencies = self.dependencies.union(operand.dependencies)
+        dependencies = self._dependencies.union(operand._dependencies)
         return BooleanExpression(sql, dependencies=dependencies)
 
     def is_null(self) -> "BooleanExpression":
         """Return a boolean expression testing whether the value is ``NULL``."""
 
         sql = f"({self.render()} IS NULL)"
-        return BooleanExpression(sql, dependencies=self.dependencies)
+        return BooleanExpression(sql, dependencies=self._dependencies)
 
     def is_not_null(self) -> "BooleanExpression":
         """Return a boolean expression testing whether the value is not ``NULL``."""
 
         sql = f"({self.render()} IS NOT NULL)"
-        return BooleanExpression(sql, dependencies=self.dependencies)
+        return BooleanExpression(sql, dependencies=self._dependencies)
 
     def _coerce_operand(self: ExpressionT, other: object) -> ExpressionT:
         raise NotImplementedError
 
     def __eq__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison("=", other)
         return NotImplemented
 
     def __ne__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison("!=", other)
         return NotImplemented
 
     def __lt__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison("<", other)
         return NotImplemented
 
     def __le__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison("<=", other)
         return NotImplemented
 
     def __gt__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison(">", other)
         return NotImplemented
 
     def __ge__(self, other: object) -> ComparisonResult:  # type: ignore[override]
-        if isinstance(
+        if type(other) in _SCALAR_OPERAND_TYPES or isinstance(
             other, (TypedExpression, str, int, float, bool, bytes, Decimal)
         ):
             return self._comparison(">=", other)
@@ -231,9 +242,8 @@ class TypedExpression:
             if not identifier:
                 msg = "Column references in window clauses cannot be empty"
                 raise ValueError(msg)
-            dependency = ExpressionDependency.column(identifier)
             sql = quote_identifier(identifier)
-            return sql, frozenset({dependency})
+            return sql, column_dependencies(identifier)
         msg = (
             "Window clauses accept column names or typed expressions; "
             f"got {type(operand)!r}"
@@ -268,17 +278,17 @@ class AliasedExpression(TypedExpression):
 
     __slots__ = ("base", "alias_name")
 
-    def __init__(self, *, base: TypedExpression, alias: str) -> None:
+    def __init__(  # pylint: disable=super-init-not-called
+        self, *, base: TypedExpression, alias: str
+    ) -> None:
         self.base = base
         self.alias_name = alias
-        super().__init__(
-            base.render(),
-            duck_type=base.duck_type,
-            dependencies=base.dependencies,
-        )
-
-    def render(self) -> str:
-        return f"{self.base.render()} AS {quote_identifier(self.alias_name)}"
+        # The base expression has already normalised its dependencies, so the
+        # slots are copied across rather than re-running TypedExpression setup.
+        # Expressions are immutable, so the aliased SQL is rendered once here.
+        self._sql = f"{base.render()} AS {quote_identifier(alias)}"
+        self.duck_type = base.duck_type
+        self._dependencies = base._dependencies
 
     def _coerce_operand(self, other: object) -> TypedExpression:  # type: ignore[override]
         return self.base._coerce_operand(other)  # pylint: disable=protected-access
@@ -321,24 +331,28 @@ class BooleanExpression(TypedExpression):
     ) -> None:
         super().__init__(
             sql,
-            duck_type=duck_type or BooleanType("BOOLEAN"),
+            duck_type=duck_type or _DEFAULT_BOOLEAN_TYPE,
             dependencies=dependencies,
         )
 
     def __and__(self, other: object) -> "BooleanExpression":
-        operand = self._coerce_operand(other)
+        operand = (
+            other if isinstance(other, BooleanExpression) else self._coerce_operand(other)
+        )
         sql = f"({self.render()} AND {operand.render()})"
-        dependencies = self.dependencies.union(operand.dependencies)
+        dependencies = self._dependencies.union(operand._dependencies)
         return BooleanExpression(sql, dependencies=dependencies)
 
     def __or__(self, other: object) -> "BooleanExpression":
-        operand = self._coerce_operand(other)
+        operand = (
+            other if isinstance(other, BooleanExpression) else self._coerce_operand(other)
+        )
         sql = f"({self.render()} OR {operand.render()})"
-        dependencies = self.dependencies.union(operand.dependencies)
+        dependencies = self._dependencies.union(operand._dependencies)
         return BooleanExpression(sql, dependencies=dependencies)
 
     def __invert__(self) -> "BooleanExpression":
-        return BooleanExpression(f"(NOT {self.render()})", dependencies=self.dependencies)
+        return BooleanExpression(f"(NOT {self.render()})", dependencies=self._dependencies)
 
     def _coerce_operand(self, other: object) -> "BooleanExpression":
         if isinstance(other, BooleanExpression):
@@ -356,10 +370,9 @@ class BooleanExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "BooleanExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         return cls(
             quote_qualified_identifier(name, table=table),
-            dependencies=(dependency,),
+            dependencies=column_dependencies(name, table=table),
         )
 
     @classmethod
@@ -390,7 +403,7 @@ class GenericExpression(TypedExpression):
     ) -> None:
         super().__init__(
             sql,
-            duck_type=duck_type or GenericType("UNKNOWN"),
+            duck_type=duck_type or _DEFAULT_GENERIC_TYPE,
             dependencies=dependencies,
         )
 
@@ -501,10 +514,9 @@ class GenericExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "GenericExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         return cls(
             quote_qualified_identifier(name, table=table),
-            dependencies=(dependency,),
+            dependencies=column_dependencies(name, table=table),
         )
 
     @classmethod
@@ -6,11 +6,13 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from ..dependencies import DependencyLike, ExpressionDependency
+from ..dependencies import DependencyLike, column_dependencies
 from ..types import BlobType, DuckDBType
 from .base import TypedExpression
 from .utils import quote_qualified_identifier
 
+_DEFAULT_BLOB_TYPE = BlobType("BLOB")
+
 
 class BlobExpression(TypedExpression):
     __slots__ = ()
@@ -24,7 +26,7 @@ class BlobExpression(TypedExpression):
     ) -> None:
         super().__init__(
             sql,
-            duck_type=duck_type or BlobType("BLOB"),
+            duck_type=duck_type or _DEFAULT_BLOB_TYPE,
             dependencies=dependencies,
         )
 
@@ -35,10 +37,9 @@ class BlobExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "BlobExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         return cls(
             quote_qualified_identifier(name, table=table),
-            dependencies=(dependency,),
+            dependencies=column_dependencies(name, table=table),
         )
 
     @classmethod
@@ -51,7 +52,7 @@ class BlobExpression(TypedExpression):
         hex_literal = value.hex()
         return cls(
             f"BLOB '\\x{hex_literal}'",
-            duck_type=duck_type or BlobType("BLOB"),
+            duck_type=duck_type or _DEFAULT_BLOB_TYPE,
         )
 
     @classmethod
@@ -74,6 +75,8 @@ class BlobExpression(TypedExpression):
 
 
 class BlobFactory:
+    __slots__ = ()
+
     def __call__(
         self,
         column: str,
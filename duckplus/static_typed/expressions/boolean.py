@@ -12,6 +12,8 @@ from .case import CaseExpressionBuilder
 
 
 class BooleanFactory:
+    __slots__ = ()
+
     def __call__(
         self,
         column: str,
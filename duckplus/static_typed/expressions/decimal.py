@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
 from .numeric import NumericExpression, NumericFactory, NumericOperand
 from ..types import DecimalType, DuckDBType
@@ -12,23 +12,34 @@ if TYPE_CHECKING:  # pragma: no cover - typing support only
     from ..expression import DuckTypeNamespace
 
 
+class _DecimalExpression(NumericExpression):
+    """Shared behaviour for the fixed precision/scale decimal expressions."""
+
+    __slots__ = ()
+    _DECIMAL_TYPE: ClassVar[DecimalType]
+
+    @classmethod
+    def default_type(cls) -> DuckDBType:
+        return cls._DECIMAL_TYPE
+
+    @classmethod
+    def default_literal_type(cls, value: NumericOperand) -> DuckDBType:
+        return cls._DECIMAL_TYPE
+
+
 def _create_decimal_expression(precision: int, scale: int) -> type[NumericExpression]:
-    class DecimalExpression(NumericExpression):  # type: ignore[misc]
-        __slots__ = ()
-
-        @classmethod
-        def default_type(cls) -> DuckDBType:  # type: ignore[override]
-            return DecimalType(precision, scale)
-
-        @classmethod
-        def default_literal_type(
-            cls, value: NumericOperand
-        ) -> DuckDBType:  # type: ignore[override]
-            return DecimalType(precision, scale)
-
-    DecimalExpression.__name__ = f"Decimal{precision}_{scale}Expression"
-    DecimalExpression.__qualname__ = DecimalExpression.__name__
-    return DecimalExpression
+    # Each factory only differs by its type metadata, so build the subclasses
+    # directly instead of compiling a class body with fresh closures per pair.
+    name = f"Decimal{precision}_{scale}Expression"
+    return type(
+        name,
+        (_DecimalExpression,),
+        {
+            "__slots__": (),
+            "__qualname__": name,
+            "_DECIMAL_TYPE": DecimalType(precision, scale),
+        },
+    )
 
 
 _DECIMAL_FACTORY_ITEMS = tuple(
@@ -5,14 +5,16 @@ from __future__ import annotations
 from typing import Iterable
 
 from ..dependencies import DependencyLike
-from ..types import DuckDBType, GenericType
-from .base import GenericExpression, TypedExpression
+from ..types import DuckDBType
+from .base import _DEFAULT_GENERIC_TYPE, GenericExpression, TypedExpression
 from .boolean import BooleanFactory
 from .case import CaseExpressionBuilder
 from .numeric import NumericFactory
 
 
 class GenericFactory:
+    __slots__ = ("_aggregate",)
+
     def __init__(self) -> None:
         self._aggregate = GenericAggregateFactory(self)
 
@@ -34,7 +36,7 @@ class GenericFactory:
         return GenericExpression(
             sql,
             dependencies=dependencies,
-            duck_type=duck_type or GenericType("UNKNOWN"),
+            duck_type=duck_type or _DEFAULT_GENERIC_TYPE,
         )
 
     def null(self) -> GenericExpression:
@@ -42,7 +44,7 @@ class GenericFactory:
 
         return GenericExpression(
             "NULL",
-            duck_type=GenericType("UNKNOWN"),
+            duck_type=_DEFAULT_GENERIC_TYPE,
         )
 
     def coerce(self, operand: object) -> GenericExpression:
@@ -72,6 +74,8 @@ class GenericFactory:
 
 
 class GenericAggregateFactory:
+    __slots__ = ("_factory", "_numeric_factory")
+
     def __init__(self, factory: GenericFactory) -> None:
         self._factory = factory
         self._numeric_factory = NumericFactory()
@@ -86,7 +90,7 @@ class GenericAggregateFactory:
         return GenericExpression(
             sql,
             dependencies=dependencies,
-            duck_type=duck_type or GenericType("UNKNOWN"),
+            duck_type=duck_type or _DEFAULT_GENERIC_TYPE,
         )
 
     def max(self, operand: object) -> GenericExpression:
@@ -7,7 +7,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Iterable
 
-from ..dependencies import DependencyLike, ExpressionDependency
+from ..dependencies import DependencyLike, column_dependencies
 from ..types import (
     DuckDBType,
     FloatingType,
@@ -57,9 +57,9 @@ class NumericExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "NumericExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         sql = quote_qualified_identifier(name, table=table)
-        return cls(sql, dependencies=(dependency,), duck_type=cls.default_type())
+        dependencies = column_dependencies(name, table=table)
+        return cls(sql, dependencies=dependencies, duck_type=cls.default_type())
 
     @classmethod
     def literal(
@@ -97,9 +97,13 @@ class NumericExpression(TypedExpression):
         raise TypeError(msg)
 
     def _binary(self, operator: str, other: object) -> "NumericExpression":
-        operand = self._coerce_operand(other)
+        # Expression operands pass through coercion unchanged, so only
+        # literals need the call.
+        operand = (
+            other if isinstance(other, NumericExpression) else self._coerce_operand(other)
+        )
         sql = f"({self.render()} {operator} {operand.render()})"
-        dependencies = self.dependencies.union(operand.dependencies)
+        dependencies = self._dependencies.union(operand._dependencies)
         return type(self)(
             sql,
             dependencies=dependencies,
@@ -194,10 +198,10 @@ class NumericExpression(TypedExpression):
 class NumericFactory:
     """Factory for creating numeric expressions."""
 
-    expression_type: type[NumericExpression] = NumericExpression
+    __slots__ = ("expression_type", "_aggregate")
 
     def __init__(self, expression_type: type[NumericExpression] | None = None) -> None:
-        self.expression_type = expression_type or type(self).expression_type
+        self.expression_type: type[NumericExpression] = expression_type or NumericExpression
         self._aggregate = NumericAggregateFactory(self)
 
     def __call__(
@@ -256,6 +260,8 @@ class NumericFactory:
 
 
 class NumericAggregateFactory:
+    __slots__ = ("_factory", "_boolean_factory")
+
     def __init__(
         self,
         factory: NumericFactory,
@@ -353,6 +359,8 @@ class NumericAggregateFactory:
 
 
 class _BaseIntegerExpression(NumericExpression):
+    __slots__ = ()
+
     @classmethod
     def default_literal_type(cls, value: NumericOperand) -> DuckDBType:
         if isinstance(value, bool) or not isinstance(value, int):
@@ -362,42 +370,56 @@ class _BaseIntegerExpression(NumericExpression):
 
 
 class TinyintExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return IntegerType("TINYINT")
 
 
 class SmallintExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return IntegerType("SMALLINT")
 
 
 class IntegerExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return IntegerType("INTEGER")
 
 
 class UnsignedTinyintExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return UtinyintType()
 
 
 class UnsignedSmallintExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return UsmallintType()
 
 
 class UnsignedIntegerExpression(_BaseIntegerExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return UintegerType()
 
 
 class FloatExpression(NumericExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return FloatingType("FLOAT")
@@ -411,6 +433,8 @@ class FloatExpression(NumericExpression):
 
 
 class DoubleExpression(NumericExpression):
+    __slots__ = ()
+
     @classmethod
     def default_type(cls) -> DuckDBType:
         return FloatingType("DOUBLE")
@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Iterable
 
-from ..dependencies import DependencyLike, ExpressionDependency
+from ..dependencies import DependencyLike, column_dependencies
 from ..types import DuckDBType, TemporalType
 from .base import TypedExpression
 from .boolean import BooleanFactory
@@ -46,9 +46,9 @@ class TemporalExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "TemporalExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         sql = quote_qualified_identifier(name, table=table)
-        return cls(sql, dependencies=(dependency,), duck_type=cls.default_type())
+        dependencies = column_dependencies(name, table=table)
+        return cls(sql, dependencies=dependencies, duck_type=cls.default_type())
 
     @classmethod
     def literal(
@@ -115,6 +115,7 @@ class TemporalExpression(TypedExpression):
 
 
 class DateExpression(TemporalExpression):
+    __slots__ = ()
     _TYPE_NAME = "DATE"
 
     @classmethod
@@ -130,6 +131,7 @@ class DateExpression(TemporalExpression):
 
 
 class TimestampExpression(TemporalExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP"
 
     @classmethod
@@ -145,26 +147,33 @@ class TimestampExpression(TemporalExpression):
 
 
 class TimestampSecondsExpression(TimestampExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP_S"
 
 
 class TimestampMillisecondsExpression(TimestampExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP_MS"
 
 
 class TimestampMicrosecondsExpression(TimestampExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP_US"
 
 
 class TimestampNanosecondsExpression(TimestampExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP_NS"
 
 
 class TimestampWithTimezoneExpression(TimestampExpression):
+    __slots__ = ()
     _TYPE_NAME = "TIMESTAMP WITH TIME ZONE"
 
 
 class TemporalFactory:
+    __slots__ = ("expression_type", "_aggregate", "_boolean_factory")
+
     def __init__(self, expression_type: type[TemporalExpression]) -> None:
         self.expression_type = expression_type
         self._aggregate = TemporalAggregateFactory(self)
@@ -235,6 +244,8 @@ class TemporalFactory:
 
 
 class TemporalAggregateFactory:
+    __slots__ = ("_factory", "_numeric_factory")
+
     def __init__(self, factory: TemporalFactory) -> None:
         self._factory = factory
         self._numeric_factory = NumericFactory()
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from ..dependencies import DependencyLike, ExpressionDependency
+from ..dependencies import DependencyLike, column_dependencies
 from ..types import DuckDBType, VarcharType
 from .base import TypedExpression, BooleanExpression, _scalar_varchar_namespace
 from .boolean import BooleanFactory
@@ -14,6 +14,8 @@ from .case import CaseExpressionBuilder
 from .numeric import NumericExpression
 from .utils import quote_qualified_identifier, quote_string
 
+_DEFAULT_VARCHAR_TYPE = VarcharType("VARCHAR")
+
 
 class VarcharExpression(TypedExpression):
     __slots__ = ()
@@ -27,7 +29,7 @@ class VarcharExpression(TypedExpression):
     ) -> None:
         super().__init__(
             sql,
-            duck_type=duck_type or VarcharType("VARCHAR"),
+            duck_type=duck_type or _DEFAULT_VARCHAR_TYPE,
             dependencies=dependencies,
         )
 
@@ -38,10 +40,9 @@ class VarcharExpression(TypedExpression):
         *,
         table: str | None = None,
     ) -> "VarcharExpression":
-        dependency = ExpressionDependency.column(name, table=table)
         return cls(
             quote_qualified_identifier(name, table=table),
-            dependencies=(dependency,),
+            dependencies=column_dependencies(name, table=table),
         )
 
     @classmethod
@@ -53,7 +54,7 @@ class VarcharExpression(TypedExpression):
     ) -> "VarcharExpression":
         return cls(
             quote_string(value),
-            duck_type=duck_type or VarcharType("VARCHAR"),
+            duck_type=duck_type or _DEFAULT_VARCHAR_TYPE,
         )
 
     @classmethod
@@ -160,9 +161,11 @@ class VarcharExpression(TypedExpression):
         raise TypeError(msg)
 
     def _concat(self, other: object) -> "VarcharExpression":
-        operand = self._coerce_operand(other)
+        operand = (
+            other if isinstance(other, VarcharExpression) else self._coerce_operand(other)
+        )
         sql = f"({self.render()} || {operand.render()})"
-        dependencies = self.dependencies.union(operand.dependencies)
+        dependencies = self._dependencies.union(operand._dependencies)
         return VarcharExpression(sql, dependencies=dependencies)
 
     def __add__(self, other: object) -> "VarcharExpression":
@@ -184,6 +187,8 @@ class VarcharExpression(TypedExpression):
 
 
 class VarcharFactory:
+    __slots__ = ()
+
     def __call__(
         self,
         column: str,
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 
 
+# Column and table names come from a small, repeated vocabulary, so memoising
+# the escape keeps repeated references from re-quoting the same identifier.
+@lru_cache(maxsize=4096)
 def quote_identifier(identifier: str) -> str:
     escaped = identifier.replace("\"", "\"\"")
     return f'"{escaped}"'
@@ -21,7 +25,20 @@ def quote_string(value: str) -> str:
     return f"'{escaped}'"
 
 
+# Small integers such as 0, 1 and page sizes recur constantly in generated
+# SQL, so their text is built once up front.
+_SMALL_INT_TEXT: dict[int, str] = {value: str(value) for value in range(-16, 257)}
+
+
 def format_numeric(value: int | float | Decimal) -> str:
+    # Plain ints and floats dominate literal rendering; an exact type check
+    # skips the bool and Decimal probes below for them.
+    value_type = type(value)
+    if value_type is int:
+        text = _SMALL_INT_TEXT.get(value)  # type: ignore[arg-type]
+        return text if text is not None else repr(value)
+    if value_type is float:
+        return repr(value)
     if isinstance(value, bool):  # bool is subclass of int, exclude early
         raise TypeError("Boolean values are not valid numeric literals")
     if isinstance(value, Decimal):
@@ -37,7 +37,6 @@ _CURRENT_CATALOG_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_catalog")
 def current_catalog(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the catalog for the active connection."""
 
@@ -46,7 +45,7 @@ def current_catalog(
         call_duckdb_function(
             _CURRENT_CATALOG_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -82,7 +81,6 @@ _CURRENT_DATABASE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_database")
 def current_database(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the active database name for the current session."""
 
@@ -91,7 +89,7 @@ def current_database(
         call_duckdb_function(
             _CURRENT_DATABASE_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -127,7 +125,6 @@ _CURRENT_QUERY_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_query")
 def current_query(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the SQL text of the query currently executing."""
 
@@ -136,7 +133,7 @@ def current_query(
         call_duckdb_function(
             _CURRENT_QUERY_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -160,7 +157,6 @@ _CURRENT_ROLE_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_role")
 def current_role(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the active role (DuckDB always reports ``duckdb``)."""
 
@@ -169,7 +165,7 @@ def current_role(
         call_duckdb_function(
             _CURRENT_ROLE_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -205,7 +201,6 @@ _CURRENT_SCHEMA_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_schema")
 def current_schema(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the default schema for new relations."""
 
@@ -214,7 +209,7 @@ def current_schema(
         call_duckdb_function(
             _CURRENT_SCHEMA_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -283,7 +278,6 @@ _CURRENT_USER_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("current_user")
 def current_user(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the name of the authenticated user (always ``duckdb``)."""
 
@@ -292,7 +286,7 @@ def current_user(
         call_duckdb_function(
             _CURRENT_USER_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
@@ -316,7 +310,6 @@ _SESSION_USER_SIGNATURES: tuple[DuckDBFunctionDefinition, ...] = (
 @duckdb_function("session_user")
 def session_user(
     self: "ScalarVarcharFunctions",
-    *operands: object,
 ) -> VarcharExpression:
     """Return the session user (DuckDB always reports ``duckdb``)."""
 
@@ -325,7 +318,7 @@ def session_user(
         call_duckdb_function(
             _SESSION_USER_SIGNATURES,
             return_category=self.return_category,
-            operands=operands,
+            operands=(),
         ),
     )
 
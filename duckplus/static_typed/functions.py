@@ -23,7 +23,7 @@ from typing import (
     cast,
 )
 
-from .dependencies import ExpressionDependency
+from .dependencies import _NO_DEPENDENCIES, ExpressionDependency
 from .expression import (
     BlobExpression,
     BooleanExpression,
@@ -54,11 +54,17 @@ from .types import (
     UnknownType,
     VarcharType,
     infer_numeric_literal_type,
+    parse_type,
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuckDBFunctionSignature:
-    """Typed representation of a DuckDB function overload."""
+    """Typed representation of a DuckDB function overload.
+
+    ``macro_definition`` records the body DuckDB reports for macro functions and
+    is informational only: calls always render ``function_name(arguments)`` and
+    let DuckDB expand the macro, so the text is never parsed at call time.
+    """
 
     schema_name: str
     function_name: str
@@ -66,13 +72,13 @@ class DuckDBFunctionSignature:
     return_type: DuckDBType | None
     parameter_types: Tuple[DuckDBType | None, ...]
     parameters: Tuple[str, ...]
-    varargs: DuckDBType | None
-    description: str | None
-    comment: str | None
-    macro_definition: str | None
+    varargs: DuckDBType | None = None
+    description: str | None = None
+    comment: str | None = None
+    macro_definition: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuckDBFunctionDefinition(DuckDBFunctionSignature):
     """Alias for backwards compatibility with the generator API."""
 
@@ -83,6 +89,8 @@ _NamespaceExprT = TypeVar("_NamespaceExprT", bound=TypedExpression)
 class _StaticFunctionNamespace(Generic[_NamespaceExprT]):
     """Registry exposing DuckDB functions for a single return category."""
 
+    __slots__ = ()
+
     function_type: ClassVar[str]
     return_category: ClassVar[str]
     _IDENTIFIER_FUNCTIONS: ClassVar[dict[str, str]]
@@ -90,25 +98,18 @@ class _StaticFunctionNamespace(Generic[_NamespaceExprT]):
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
-        inherited_identifiers = dict(getattr(cls, "_IDENTIFIER_FUNCTIONS", ()))
-        inherited_symbols = dict(getattr(cls, "_SYMBOLIC_FUNCTIONS", ()))
-        cls._IDENTIFIER_FUNCTIONS = inherited_identifiers
-        cls._SYMBOLIC_FUNCTIONS = inherited_symbols
+        identifiers = dict(getattr(cls, "_IDENTIFIER_FUNCTIONS", ()))
+        symbols = dict(getattr(cls, "_SYMBOLIC_FUNCTIONS", ()))
         for attribute_name, attribute in cls.__dict__.items():
-            identifiers = cast(
-                tuple[str, ...] | None,
-                getattr(attribute, "__duckdb_identifiers__", None),
-            )
-            symbols = cast(
-                tuple[str, ...] | None,
-                getattr(attribute, "__duckdb_symbols__", None),
-            )
-            if identifiers or symbols:
-                cls._register_function(
-                    attribute_name,
-                    names=identifiers or (),
-                    symbols=symbols or (),
-                )
+            # Transitional compatibility: ``setdefault`` keeps the mappings legacy
+            # namespaces still declare manually in `_IDENTIFIER_FUNCTIONS` or
+            # `_SYMBOLIC_FUNCTIONS`.
+            for identifier in getattr(attribute, "__duckdb_identifiers__", None) or ():
+                identifiers.setdefault(identifier, attribute_name)
+            for symbol in getattr(attribute, "__duckdb_symbols__", None) or ():
+                symbols.setdefault(symbol, attribute_name)
+        cls._IDENTIFIER_FUNCTIONS = identifiers
+        cls._SYMBOLIC_FUNCTIONS = symbols
 
     @classmethod
     def _register_function(
@@ -122,20 +123,12 @@ class _StaticFunctionNamespace(Generic[_NamespaceExprT]):
             cls._IDENTIFIER_FUNCTIONS = {}
         if "_SYMBOLIC_FUNCTIONS" not in cls.__dict__:
             cls._SYMBOLIC_FUNCTIONS = {}
+        # Transitional compatibility: prefer the existing mapping when legacy
+        # namespaces pre-populated the registries.
         for identifier in names:
-            existing = cls._IDENTIFIER_FUNCTIONS.get(identifier)
-            if existing is not None and existing != attribute_name:
-                # Transitional compatibility: prefer the class-defined mapping when
-                # legacy namespaces still declare `_IDENTIFIER_FUNCTIONS` manually.
-                continue
-            cls._IDENTIFIER_FUNCTIONS[identifier] = attribute_name
+            cls._IDENTIFIER_FUNCTIONS.setdefault(identifier, attribute_name)
         for symbol in symbols:
-            existing = cls._SYMBOLIC_FUNCTIONS.get(symbol)
-            if existing is not None and existing != attribute_name:
-                # Transitional compatibility: keep the original symbol mapping when
-                # older namespaces pre-populated `_SYMBOLIC_FUNCTIONS`.
-                continue
-            cls._SYMBOLIC_FUNCTIONS[symbol] = attribute_name
+            cls._SYMBOLIC_FUNCTIONS.setdefault(symbol, attribute_name)
 
     def __getitem__(self, name: str) -> Callable[..., _NamespaceExprT]:
         method = self.get(name)
@@ -179,8 +172,10 @@ def duckdb_function(
 ) -> Callable[[Callable[..., _NamespaceExprT]], Callable[..., _NamespaceExprT]]:
     """Decorator registering functions on typed namespaces at definition time."""
 
-    alias_names = tuple(dict.fromkeys(names))
-    normalized_symbols = tuple(dict.fromkeys(symbols))
+    # Generated namespaces decorate every method with a single name and no
+    # symbols, so only de-duplicate when there is something to collapse.
+    alias_names = tuple(dict.fromkeys(names)) if len(names) > 1 else names
+    normalized_symbols = tuple(dict.fromkeys(symbols)) if symbols else ()
 
     def decorator(
         func: Callable[..., _NamespaceExprT],
@@ -350,60 +345,198 @@ def _infer_operand_type(operand: object) -> DuckDBType | None:
     return None
 
 
+_DispatchCandidate = tuple[
+    DuckDBFunctionSignature,
+    int,
+    Tuple[DuckDBType | None, ...],
+    DuckDBType | None,
+]
+
+
+class _DispatchPlan:
+    """Overload analysis prepared once per signature tuple."""
+
+    __slots__ = (
+        "signatures",
+        "candidates",
+        "typed",
+        "_by_arity",
+        "_expression_types",
+        "_selections",
+        "_nullary",
+    )
+
+    def __init__(self, signatures: Sequence[DuckDBFunctionSignature]) -> None:
+        self.signatures = signatures
+        self.candidates = tuple(
+            (
+                signature,
+                len(signature.parameter_types),
+                signature.parameter_types,
+                signature.varargs,
+            )
+            for signature in signatures
+        )
+        # Untyped overloads score identically for every operand, so the first
+        # overload with a matching arity wins without inspecting the operands.
+        self.typed = any(
+            signature.varargs is not None
+            or any(parameter is not None for parameter in signature.parameter_types)
+            for signature in signatures
+        )
+        self._by_arity: dict[int, tuple[_DispatchCandidate, ...]] = {}
+        self._expression_types: dict[tuple[int, str], type[TypedExpression]] = {}
+        self._selections: dict[
+            tuple[DuckDBType | None, ...], DuckDBFunctionSignature
+        ] = {}
+        self._nullary: dict[str, TypedExpression] = {}
+
+    def _candidates_for(self, argument_count: int) -> tuple[_DispatchCandidate, ...]:
+        """Return the overloads accepting ``argument_count`` operands, in catalogue order."""
+
+        candidates = self._by_arity.get(argument_count)
+        if candidates is None:
+            candidates = tuple(
+                candidate
+                for candidate in self.candidates
+                if (
+                    argument_count >= candidate[1]
+                    if candidate[3] is not None
+                    else argument_count == candidate[1]
+                )
+            )
+            self._by_arity[argument_count] = candidates
+        return candidates
+
+    def select(self, operands: Sequence[object]) -> DuckDBFunctionSignature:
+        """Return the best matching signature for ``operands``."""
+
+        argument_count = len(operands)
+        candidates = self._candidates_for(argument_count)
+        if not candidates:
+            raise self._no_overload(argument_count)
+        if not self.typed:
+            return candidates[0][0]
+
+        # Scoring only looks at the inferred operand types, and DuckDB types
+        # compare by value, so the winner can be reused for identical shapes.
+        operand_types = tuple(_infer_operand_type(operand) for operand in operands)
+        selected = self._selections.get(operand_types)
+        if selected is not None:
+            return selected
+        selected = self._score(candidates, operand_types)
+        if len(self._selections) >= _SELECTION_CACHE_SIZE:
+            self._selections.clear()
+        self._selections[operand_types] = selected
+        return selected
+
+    def _score(
+        self,
+        candidates: tuple[_DispatchCandidate, ...],
+        operand_types: tuple[DuckDBType | None, ...],
+    ) -> DuckDBFunctionSignature:
+        argument_count = len(operand_types)
+        best_signature: DuckDBFunctionSignature | None = None
+        best_score: tuple[int, int] | None = None
+
+        for signature, required, parameter_types, varargs in candidates:
+            expected_types: Sequence[DuckDBType | None] = parameter_types
+            if argument_count > required:
+                expected_types = (*parameter_types, *([varargs] * (argument_count - required)))
+
+            typed_matches = 0
+            typed_fallbacks = 0
+            compatible = True
+            for expected, actual in zip(expected_types, operand_types, strict=False):
+                if expected is None or actual is None:
+                    if actual is not None and expected is None:
+                        typed_fallbacks += 1
+                    continue
+                if expected.accepts(actual):
+                    typed_matches += 1
+                else:
+                    compatible = False
+                    break
+
+            if not compatible:
+                continue
+
+            score = (typed_matches, -typed_fallbacks)
+            if best_score is None or score > best_score:
+                best_signature = signature
+                best_score = score
+
+        if best_signature is not None:
+            return best_signature
+        raise self._no_overload(argument_count)
+
+    def expression_type(
+        self,
+        signature: DuckDBFunctionSignature,
+        return_category: str,
+    ) -> type[TypedExpression]:
+        """Return the expression class for ``signature``, resolved once per category."""
+
+        # ``signature`` always belongs to ``self.signatures``, so its identity is
+        # stable for the lifetime of the plan and cheaper to hash than its fields.
+        key = (id(signature), return_category)
+        expression_type = self._expression_types.get(key)
+        if expression_type is None:
+            expression_type = _expression_type_for_signature(signature, return_category)
+            self._expression_types[key] = expression_type
+        return expression_type
+
+    def nullary_expression(self, return_category: str) -> TypedExpression:
+        """Return the shared expression for a zero-argument call without clauses."""
+
+        # The rendered SQL cannot vary between calls and expressions are never
+        # mutated after construction, so every caller can share one instance.
+        expression = self._nullary.get(return_category)
+        if expression is None:
+            signature = self.select(())
+            expression = _instantiate_expression(
+                self.expression_type(signature, return_category),
+                _render_sql(signature, []),
+                duck_type=signature.return_type,
+                dependencies=_NO_DEPENDENCIES,
+            )
+            self._nullary[return_category] = expression
+        return expression
+
+    def _no_overload(self, argument_count: int) -> TypeError:
+        function_name = self.signatures[0].function_name if self.signatures else "<unknown>"
+        msg = (
+            f"No DuckDB overload found for {function_name} with {argument_count} "
+            "argument(s)"
+        )
+        return TypeError(msg)
+
+
+_DISPATCH_PLAN_CACHE_SIZE = 8192
+_SELECTION_CACHE_SIZE = 256
+_DISPATCH_PLANS: dict[int, _DispatchPlan] = {}
+
+
+def _dispatch_plan(signatures: Sequence[DuckDBFunctionSignature]) -> _DispatchPlan:
+    """Return the cached dispatch plan for an immutable signature tuple."""
+
+    if not isinstance(signatures, tuple):
+        return _DispatchPlan(signatures)
+    plan = _DISPATCH_PLANS.get(id(signatures))
+    if plan is not None and plan.signatures is signatures:
+        return plan
+    if len(_DISPATCH_PLANS) >= _DISPATCH_PLAN_CACHE_SIZE:
+        _DISPATCH_PLANS.clear()
+    plan = _DispatchPlan(signatures)
+    _DISPATCH_PLANS[id(signatures)] = plan
+    return plan
+
+
 def _select_signature(
     signatures: Sequence[DuckDBFunctionSignature],
     operands: Sequence[object],
 ) -> DuckDBFunctionSignature:
-    argument_count = len(operands)
-    operand_types = [_infer_operand_type(operand) for operand in operands]
-    best_signature: DuckDBFunctionSignature | None = None
-    best_score: tuple[int, int] | None = None
-
-    for signature in signatures:
-        required = len(signature.parameter_types)
-        if signature.varargs is not None:
-            if argument_count < required:
-                continue
-        elif argument_count != required:
-            continue
-
-        expected_types = list(signature.parameter_types)
-        if argument_count > len(expected_types):
-            if signature.varargs is None:
-                continue
-            expected_types.extend([signature.varargs] * (argument_count - len(expected_types)))
-
-        typed_matches = 0
-        typed_fallbacks = 0
-        compatible = True
-        for expected, actual in zip(expected_types, operand_types, strict=False):
-            if expected is None or actual is None:
-                if actual is not None and expected is None:
-                    typed_fallbacks += 1
-                continue
-            if expected.accepts(actual):
-                typed_matches += 1
-            else:
-                compatible = False
-                break
-
-        if not compatible:
-            continue
-
-        score = (typed_matches, -typed_fallbacks)
-        if best_score is None or score > best_score:
-            best_signature = signature
-            best_score = score
-
-    if best_signature is not None:
-        return best_signature
-
-    function_name = signatures[0].function_name if signatures else "<unknown>"
-    msg = (
-        f"No DuckDB overload found for {function_name} with {argument_count} "
-        "argument(s)"
-    )
-    raise TypeError(msg)
+    return _dispatch_plan(signatures).select(operands)
 
 
 def _build_arguments(
@@ -582,6 +715,22 @@ def _build_window_clause(
     return f"({window_spec})", frozenset(dependencies)
 
 
+def _has_clauses(
+    order_by: Iterable[object] | object | None,
+    within_group: Iterable[object] | object | None,
+    partition_by: Iterable[object] | object | None,
+    over_order_by: Iterable[object] | object | None,
+    frame: str | None,
+) -> bool:
+    return (
+        order_by is not None
+        or within_group is not None
+        or partition_by is not None
+        or over_order_by is not None
+        or frame is not None
+    )
+
+
 def _compose_function_sql(
     signature: DuckDBFunctionSignature,
     arguments: list[str],
@@ -592,6 +741,10 @@ def _compose_function_sql(
     over_order_by: Iterable[object] | object | None = None,
     frame: str | None = None,
 ) -> tuple[str, str | None, frozenset[ExpressionDependency]]:
+    if not _has_clauses(order_by, within_group, partition_by, over_order_by, frame):
+        # Plain scalar calls carry no clauses; skip normalising empty operands.
+        return _render_sql(signature, arguments), None, frozenset()
+
     order_clause, order_dependencies = _build_order_clause(order_by)
     sql = _render_sql(signature, arguments, order_clause=order_clause)
 
@@ -634,9 +787,9 @@ def _expression_type_for_signature(
 
 def call_duckdb_function(
     signatures: Sequence[DuckDBFunctionDefinition],
-    *,
     return_category: str,
     operands: Sequence[object],
+    *,
     order_by: Iterable[object] | object | None = None,
     within_group: Iterable[object] | object | None = None,
     partition_by: Iterable[object] | object | None = None,
@@ -646,10 +799,12 @@ def call_duckdb_function(
     if not signatures:
         msg = "Function call requires at least one signature"
         raise ValueError(msg)
-    signature = _select_signature(
-        cast(Sequence[DuckDBFunctionSignature], signatures),
-        operands,
-    )
+    plan = _dispatch_plan(cast(Sequence[DuckDBFunctionSignature], signatures))
+    if not operands and not _has_clauses(
+        order_by, within_group, partition_by, over_order_by, frame
+    ):
+        return plan.nullary_expression(return_category)
+    signature = plan.select(operands)
     arguments, dependencies = _build_arguments(signature, operands)
     sql, window_clause, clause_dependencies = _compose_function_sql(
         signature,
@@ -660,10 +815,11 @@ def call_duckdb_function(
         over_order_by=over_order_by,
         frame=frame,
     )
-    dependencies = frozenset((*dependencies, *clause_dependencies))
+    if clause_dependencies:
+        dependencies |= clause_dependencies
     if window_clause is not None:
         sql = f"{sql} OVER {window_clause}"
-    expression_type = _expression_type_for_signature(signature, return_category)
+    expression_type = plan.expression_type(signature, return_category)
     return _instantiate_expression(
         expression_type,
         sql,
@@ -675,9 +831,9 @@ def call_duckdb_function(
 def call_duckdb_filter_function(
     predicate: object,
     signatures: Sequence[DuckDBFunctionDefinition],
-    *,
     return_category: str,
     operands: Sequence[object],
+    *,
     order_by: Iterable[object] | object | None = None,
     within_group: Iterable[object] | object | None = None,
     partition_by: Iterable[object] | object | None = None,
@@ -688,10 +844,8 @@ def call_duckdb_filter_function(
         msg = "Function call requires at least one signature"
         raise ValueError(msg)
     condition = _coerce_operand(predicate, BooleanType("BOOLEAN"))
-    signature = _select_signature(
-        cast(Sequence[DuckDBFunctionSignature], signatures),
-        operands,
-    )
+    plan = _dispatch_plan(cast(Sequence[DuckDBFunctionSignature], signatures))
+    signature = plan.select(operands)
     arguments, dependencies = _build_arguments(signature, operands)
     sql, window_clause, clause_dependencies = _compose_function_sql(
         signature,
@@ -702,11 +856,12 @@ def call_duckdb_filter_function(
         over_order_by=over_order_by,
         frame=frame,
     )
-    dependencies = frozenset((*dependencies, *clause_dependencies))
+    if clause_dependencies:
+        dependencies |= clause_dependencies
     clause = f"{sql} FILTER (WHERE {condition.render()})"
     if window_clause is not None:
         clause = f"{clause} OVER {window_clause}"
-    expression_type = _expression_type_for_signature(signature, return_category)
+    expression_type = plan.expression_type(signature, return_category)
     merged = frozenset((*dependencies, *condition.dependencies))
     return _instantiate_expression(
         expression_type,
@@ -716,6 +871,104 @@ def call_duckdb_filter_function(
     )
 
 
+class _LazySignatures:
+    """Class attribute that builds a signature tuple on first access.
+
+    The built tuple replaces the descriptor on the defining class, so later
+    lookups are plain class attribute reads.
+    """
+
+    __slots__ = ("_builder", "_name")
+
+    def __init__(self, builder: Callable[[], tuple[DuckDBFunctionDefinition, ...]]) -> None:
+        self._builder = builder
+        self._name: str | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(
+        self,
+        instance: object,
+        owner: type | None = None,
+    ) -> tuple[DuckDBFunctionDefinition, ...]:
+        signatures = self._builder()
+        if owner is not None and self._name is not None:
+            for klass in owner.__mro__:
+                if klass.__dict__.get(self._name) is self:
+                    setattr(klass, self._name, signatures)
+                    break
+        return signatures
+
+
+def _format_overload_doc(function_name: str, overloads: Iterable[str]) -> str:
+    """Render the ``Overloads:`` docstring used by generated namespace methods.
+
+    Mirrors the layout emitted by ``scripts/generate_function_namespaces.py`` so
+    factory-built methods read the same as generated ones in ``help()``.
+    """
+
+    lines = [f"Call DuckDB function ``{function_name}``.", "", "Overloads:"]
+    lines.extend(f"- {overload}" for overload in overloads)
+    return "\n".join(lines)
+
+
+def _list_aggregate_method(
+    aggregate: str,
+    *,
+    function_type: str,
+    return_type: str | None,
+    owner: str,
+    module: str,
+) -> tuple[Callable[..., TypedExpression], _LazySignatures]:
+    """Build the ``list_<aggregate>`` method wrapping DuckDB's ``list_aggr`` macro.
+
+    DuckDB defines every ``list_<aggregate>`` helper as ``list_aggr(l, '<aggregate>')``
+    so the generated namespaces share this factory instead of repeating identical
+    method bodies. Returns the decorated method alongside a lazily built
+    signature tuple; neither is materialised until first use.
+    """
+
+    function_name = f"list_{aggregate}"
+    signatures: tuple[DuckDBFunctionDefinition, ...] | None = None
+
+    def build() -> tuple[DuckDBFunctionDefinition, ...]:
+        nonlocal signatures
+        if signatures is None:
+            signatures = (
+                DuckDBFunctionDefinition(
+                    schema_name="main",
+                    function_name=function_name,
+                    function_type=function_type,
+                    return_type=parse_type(return_type),
+                    parameter_types=(None,),
+                    parameters=("l",),
+                    macro_definition=f"list_aggr(l, '{aggregate}')",
+                ),
+            )
+        return signatures
+
+    def method(
+        self: _StaticFunctionNamespace[TypedExpression],
+        operand: object,
+        /,
+    ) -> TypedExpression:
+        return call_duckdb_function(
+            signatures or build(),
+            self.return_category,
+            (operand,),
+        )
+
+    method.__name__ = function_name
+    method.__qualname__ = f"{owner}.{function_name}"
+    method.__module__ = module
+    method.__doc__ = _format_overload_doc(
+        function_name,
+        (f"main.{function_name}(ANY l) -> {return_type or 'ANY'}",),
+    )
+    return duckdb_function(function_name)(method), _LazySignatures(build)
+
+
 __all__ = [
     "DuckDBFunctionDefinition",
     "DuckDBFunctionSignature",
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 from .base import (
@@ -132,8 +133,14 @@ def _build_simple_type(name: str) -> DuckDBType | None:
     return None
 
 
+@lru_cache(maxsize=1024)
 def parse_type(type_spec: str | None) -> DuckDBType | None:
-    """Parse ``type_spec`` into a :class:`DuckDBType` hierarchy."""
+    """Parse ``type_spec`` into a :class:`DuckDBType` hierarchy.
+
+    Results are cached because DuckDB types are immutable value objects and the
+    generated function namespaces parse the same handful of type strings
+    thousands of times during import.
+    """
 
     if type_spec is None:
         return None
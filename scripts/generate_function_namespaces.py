@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping
 import keyword
 from pathlib import Path
-from textwrap import indent
+import re
+from typing import NamedTuple
 
 import duckdb
 
@@ -33,6 +35,18 @@ CATEGORY_TO_EXPRESSION = {
     "generic": "TypedExpression",
 }
 STUB_VALID_TYPE_IGNORE = {"list"}
+AGGREGATE_RESERVED_PARAMETERS = frozenset(
+    {"predicate", "order_by", "within_group", "partition_by", "over_order_by", "frame"}
+)
+LIST_AGGREGATE_MACRO = re.compile(r"list_aggr\(l, '(?P<aggregate>[a-z_]+)'\)")
+TYPE_CONSTANT_CHARACTERS = re.compile(r"[^0-9A-Za-z]+")
+
+
+class _GeneratedConstants(NamedTuple):
+    """Module-level constant names shared by every generated definition."""
+
+    parameters: dict[tuple[str, ...], str]
+    types: Mapping[str, str]
 
 
 def _categorise_return_type(return_type: str | None) -> str:
@@ -250,21 +264,147 @@ def _load_definitions() -> dict[
     return index
 
 
-def _format_type(type_spec: str | None) -> str:
+def _format_type(
+    type_spec: str | None,
+    type_constants: Mapping[str, str] | None = None,
+) -> str:
     if type_spec is None:
         return "None"
+    if type_constants and type_spec in type_constants:
+        return type_constants[type_spec]
     return f"parse_type({type_spec!r})"
 
 
-def _format_parameters(parameters: tuple[str, ...]) -> str:
+def _format_parameters(
+    parameters: tuple[str, ...],
+    type_constants: Mapping[str, str] | None = None,
+) -> str:
     if not parameters:
         return "()"
-    formatted = ", ".join(_format_type(parameter) for parameter in parameters)
+    formatted = ", ".join(_format_type(parameter, type_constants) for parameter in parameters)
     if len(parameters) == 1:
         formatted += ","
     return f"({formatted})"
 
 
+def _parameter_constant_names(
+    index: dict[
+        str,
+        dict[
+            str,
+            dict[
+                str,
+                list[
+                    tuple[
+                        str,
+                        str,
+                        str | None,
+                        tuple[str, ...],
+                        tuple[str, ...],
+                        str | None,
+                        str | None,
+                        str | None,
+                        str | None,
+                    ]
+                ],
+            ],
+        ],
+    ],
+) -> dict[tuple[str, ...], str]:
+    """Name the parameter-type tuples shared by more than one overload."""
+
+    counts: dict[tuple[str, ...], int] = defaultdict(int)
+    for categories in index.values():
+        for functions in categories.values():
+            for overloads in functions.values():
+                for overload in overloads:
+                    counts[overload[3]] += 1
+    shared = sorted(
+        (parameters for parameters, count in counts.items() if parameters and count > 1),
+        key=lambda parameters: (len(parameters), _format_parameters(parameters)),
+    )
+    names: dict[tuple[str, ...], str] = {}
+    typed_count = 0
+    for parameters in shared:
+        if all(parameter is None for parameter in parameters):
+            names[parameters] = f"_UNTYPED_PARAMETERS_{len(parameters)}"
+        else:
+            names[parameters] = f"_PARAMETER_TYPES_{typed_count}"
+            typed_count += 1
+    return names
+
+
+def _render_parameter_constants(
+    names: dict[tuple[str, ...], str],
+    *,
+    type_constants: Mapping[str, str],
+) -> list[str]:
+    return [
+        f"{constant_name} = {_format_parameters(parameters, type_constants)}"
+        for parameters, constant_name in names.items()
+    ]
+
+
+def _type_constant_names(
+    index: dict[
+        str,
+        dict[
+            str,
+            dict[
+                str,
+                list[
+                    tuple[
+                        str,
+                        str,
+                        str | None,
+                        tuple[str, ...],
+                        tuple[str, ...],
+                        str | None,
+                        str | None,
+                        str | None,
+                        str | None,
+                    ]
+                ],
+            ],
+        ],
+    ],
+) -> dict[str, str]:
+    """Name the type strings parsed more than once so each is parsed at import once."""
+
+    counts: dict[str, int] = defaultdict(int)
+    overloads = (
+        overload
+        for categories in index.values()
+        for functions in categories.values()
+        for function_overloads in functions.values()
+        for overload in function_overloads
+    )
+    for overload in overloads:
+        for type_spec in (overload[2], *overload[3], overload[5]):
+            if type_spec is not None:
+                counts[type_spec] += 1
+    names: dict[str, str] = {}
+    taken: set[str] = set()
+    for type_spec in sorted(spec for spec, count in counts.items() if count > 1):
+        normalized = TYPE_CONSTANT_CHARACTERS.sub("_", type_spec.replace("[]", " LIST"))
+        base_name = f"_TYPE_{normalized.strip('_').upper() or 'UNKNOWN'}"
+        constant_name = base_name
+        suffix = 2
+        while constant_name in taken:
+            constant_name = f"{base_name}_{suffix}"
+            suffix += 1
+        taken.add(constant_name)
+        names[type_spec] = constant_name
+    return names
+
+
+def _render_type_constants(names: dict[str, str]) -> list[str]:
+    return [
+        f"{constant_name} = parse_type({type_spec!r})"
+        for type_spec, constant_name in names.items()
+    ]
+
+
 def _format_parameter_names(names: tuple[str, ...]) -> str:
     if not names:
         return "()"
@@ -284,23 +424,38 @@ def _format_definition(
     description: str | None,
     comment: str | None,
     macro_definition: str | None,
+    *,
+    function_type: str,
+    constants: _GeneratedConstants,
 ) -> str:
-    return "\n".join(
-        [
-            "            DuckDBFunctionDefinition(",
-            f"                schema_name={schema!r},",
-            f"                function_name={name!r},",
-            "                function_type=function_type,",
-            f"                return_type={_format_type(return_type)},",
-            f"                parameter_types={_format_parameters(parameters)},",
-            f"                parameters={_format_parameter_names(parameter_names)},",
-            f"                varargs={_format_type(varargs)},",
-            f"                description={description!r},",
-            f"                comment={comment!r},",
-            f"                macro_definition={macro_definition!r},",
-            "            ),",
-        ]
+    type_constants = constants.types
+    parameter_types = constants.parameters.get(parameters) or _format_parameters(
+        parameters, type_constants
     )
+    # The six required fields are passed positionally in declaration order
+    # (schema, name, type, return type, parameter types, parameter names) to
+    # keep keyword binding out of the thousands of import-time constructions.
+    lines = [
+        "            DuckDBFunctionDefinition(",
+        f"                {schema!r},",
+        f"                {name!r},",
+        f"                {function_type!r},",
+        f"                {_format_type(return_type, type_constants)},",
+        f"                {parameter_types},",
+        f"                {_format_parameter_names(parameter_names)},",
+    ]
+    # Trailing metadata defaults to ``None`` on the dataclass; only spell out
+    # the fields that carry a value.
+    if varargs is not None:
+        lines.append(f"                varargs={_format_type(varargs, type_constants)},")
+    if description is not None:
+        lines.append(f"                description={description!r},")
+    if comment is not None:
+        lines.append(f"                comment={comment!r},")
+    if macro_definition is not None:
+        lines.append(f"                macro_definition={macro_definition!r},")
+    lines.append("            ),")
+    return "\n".join(lines)
 
 
 def _signature_constant_name(name: str) -> str:
@@ -398,22 +553,26 @@ def _render_signature_constant(
             str | None,
         ]
     ],
+    *,
+    function_type: str,
+    constants: _GeneratedConstants,
 ) -> str:
-    lines = [f"    {constant_name}: ClassVar[tuple[DuckDBFunctionDefinition, ...]] = ("]
+    # Definitions are built on first access. Class-body names are not visible
+    # inside the lambda, so ``function_type`` is spelled out as a literal.
+    lines = [f"    {constant_name} = _LazySignatures(", "        lambda: ("]
     lines.extend(
-        indent(
-            _format_definition(
-                schema,
-                name,
-                return_type,
-                parameter_types,
-                parameter_names,
-                varargs,
-                description,
-                comment,
-                macro_definition,
-            ),
-            "        ",
+        _format_definition(
+            schema,
+            name,
+            return_type,
+            parameter_types,
+            parameter_names,
+            varargs,
+            description,
+            comment,
+            macro_definition,
+            function_type=function_type,
+            constants=constants,
         )
         for (
             schema,
@@ -427,10 +586,106 @@ def _render_signature_constant(
             macro_definition,
         ) in overloads
     )
-    lines.append("    )")
+    lines.extend(["        )", "    )"])
     return "\n".join(lines)
 
 
+def _fixed_parameter_names(
+    overloads: list[
+        tuple[
+            str,
+            str,
+            str | None,
+            tuple[str, ...],
+            tuple[str, ...],
+            str | None,
+            str | None,
+            str | None,
+            str | None,
+        ]
+    ],
+    *,
+    reserved: frozenset[str] = frozenset(),
+) -> tuple[str, ...] | None:
+    """Return positional parameter names when every overload shares one arity."""
+
+    arities = {len(overload[3]) for overload in overloads}
+    if len(arities) != 1 or any(overload[5] is not None for overload in overloads):
+        return None
+    (arity,) = arities
+    names = overloads[0][4]
+    if (
+        len(names) != arity
+        or len(set(names)) != arity
+        or any(
+            not name.isidentifier()
+            or keyword.iskeyword(name)
+            or name == "self"
+            or name in reserved
+            for name in names
+        )
+    ):
+        return tuple(f"arg{index}" for index in range(arity))
+    return names
+
+
+def _format_operand_tuple(names: tuple[str, ...]) -> str:
+    if len(names) == 1:
+        return f"({names[0]},)"
+    return f"({', '.join(names)})"
+
+
+def _method_parameters(
+    overloads: list[
+        tuple[
+            str,
+            str,
+            str | None,
+            tuple[str, ...],
+            tuple[str, ...],
+            str | None,
+            str | None,
+            str | None,
+            str | None,
+        ]
+    ],
+    *,
+    function_type: str,
+    filter_variant: bool = False,
+    default: str = "None",
+) -> tuple[str, str]:
+    """Return the parameter list after ``self`` and the operand expression."""
+
+    aggregate = function_type == "aggregate"
+    fixed_parameters = _fixed_parameter_names(
+        overloads,
+        reserved=AGGREGATE_RESERVED_PARAMETERS if aggregate else frozenset(),
+    )
+    if fixed_parameters is not None:
+        positional = ("predicate", *fixed_parameters) if filter_variant else fixed_parameters
+        signature = "".join(f", {name}: object" for name in positional)
+        if positional:
+            signature += ", /"
+        if aggregate:
+            signature += ", *"
+        operands = _format_operand_tuple(fixed_parameters)
+    else:
+        if filter_variant:
+            signature = ", predicate: object, *operands: object"
+        else:
+            signature = ", *operands: object"
+        operands = "operands"
+    if aggregate:
+        signature += (
+            f", order_by: Iterable[object] | object | None = {default},"
+            f" within_group: Iterable[object] | object | None = {default},"
+            f" partition_by: Iterable[object] | object | None = {default},"
+            f" over_order_by: Iterable[object] | object | None = {default},"
+            f" frame: str | None = {default}"
+        )
+    return signature, operands
+
+
 def _render_method(
     method_name: str,
     *,
@@ -455,15 +710,11 @@ def _render_method(
     original_name: str | None = None,
     registered_names: tuple[str, ...] | None = None,
 ) -> str:
-    signature = "predicate: object, *operands: object" if filter_variant else "*operands: object"
-    if function_type == "aggregate":
-        signature += (
-            ", order_by: Iterable[object] | object | None = None,"
-            " within_group: Iterable[object] | object | None = None,"
-            " partition_by: Iterable[object] | object | None = None,"
-            " over_order_by: Iterable[object] | object | None = None,"
-            " frame: str | None = None"
-        )
+    signature, operands = _method_parameters(
+        overloads,
+        function_type=function_type,
+        filter_variant=filter_variant,
+    )
     decorator_parts: list[str] = []
     if registered_names:
         decorator_parts.append(", ".join(repr(name) for name in registered_names))
@@ -474,7 +725,7 @@ def _render_method(
         lines = [f"    @duckdb_function({decorator_call})"]
     else:
         lines = ["    @duckdb_function()"]
-    lines.append(f"    def {method_name}(self, {signature}) -> {expression}:")
+    lines.append(f"    def {method_name}(self{signature}) -> {expression}:")
     lines.append(
         _docstring_for_function(
             original_name or method_name,
@@ -483,14 +734,17 @@ def _render_method(
             symbol=symbol,
         )
     )
+    # Methods read their signatures through ``self`` rather than capturing the
+    # tuple: override modules rebind ``_X_SIGNATURES`` per namespace class and
+    # share one method across classes (see ``duckplus.functions.aggregate``).
     if filter_variant:
         lines.extend(
             [
                 "        return call_duckdb_filter_function(",
                 "            predicate,",
                 f"            self.{constant_name},",
-                "            return_category=self.return_category,",
-                "            operands=operands,",
+                "            self.return_category,",
+                f"            {operands},",
                 *(
                     [
                         "            order_by=order_by,",
@@ -510,8 +764,8 @@ def _render_method(
             [
                 "        return call_duckdb_function(",
                 f"            self.{constant_name},",
-                "            return_category=self.return_category,",
-                "            operands=operands,",
+                "            self.return_category,",
+                f"            {operands},",
                 *(
                     [
                         "            order_by=order_by,",
@@ -529,6 +783,73 @@ def _render_method(
     return "\n".join(lines)
 
 
+def _list_aggregate_name(
+    function_name: str,
+    overloads: list[
+        tuple[
+            str,
+            str,
+            str | None,
+            tuple[str, ...],
+            tuple[str, ...],
+            str | None,
+            str | None,
+            str | None,
+            str | None,
+        ]
+    ],
+) -> str | None:
+    if len(overloads) != 1:
+        return None
+    (
+        schema,
+        name,
+        _return_type,
+        parameter_types,
+        parameter_names,
+        varargs,
+        description,
+        comment,
+        macro_definition,
+    ) = overloads[0]
+    if name != function_name or macro_definition is None:
+        return None
+    if (schema, parameter_types, parameter_names, varargs, description, comment) != (
+        "main",
+        (None,),
+        ("l",),
+        None,
+        None,
+        None,
+    ):
+        return None
+    match = LIST_AGGREGATE_MACRO.fullmatch(macro_definition)
+    if match is None or function_name != f"list_{match['aggregate']}":
+        return None
+    return match["aggregate"]
+
+
+def _render_list_aggregate(
+    function_name: str,
+    *,
+    aggregate: str,
+    class_name: str,
+    constant_name: str,
+    return_type: str | None,
+) -> str:
+    return "\n".join(
+        [
+            f"    {function_name}, {constant_name} = _list_aggregate_method(",
+            f"        {aggregate!r},",
+            "        function_type=function_type,",
+            f"        return_type={return_type!r},",
+            f"        owner={class_name!r},",
+            "        module=__name__,",
+            "    )",
+        ]
+    )
+
+
 def _render_namespace(
     *,
     function_type: str,
@@ -565,21 +886,42 @@ def _render_namespace(
             ]
         ],
     ],
+    constants: _GeneratedConstants,
 ) -> str:
     class_name = f"{function_type.title()}{category.title()}Functions"
     doc_category = RETURN_CATEGORY_DOCS.get(category, category)
     doc = f"DuckDB {function_type} functions returning {doc_category} results."
     expression = CATEGORY_TO_EXPRESSION[category]
-    identifier_registry: dict[str, str] = {}
-    symbol_registry: dict[str, str] = {}
-
     lines: list[str] = [f"class {class_name}(_StaticFunctionNamespace):", f"    \"\"\"{doc}\"\"\""]
     lines.append("    __slots__ = ()")
     lines.append("    function_type: ClassVar[str] = " + repr(function_type))
     lines.append("    return_category: ClassVar[str] = " + repr(category))
     for function_name in sorted(identifiers):
         constant_name = _signature_constant_name(function_name)
-        lines.append(_render_signature_constant(constant_name, identifiers[function_name]))
+        aggregate = (
+            _list_aggregate_name(function_name, identifiers[function_name])
+            if function_type == "scalar"
+            else None
+        )
+        if aggregate is not None:
+            lines.append(
+                _render_list_aggregate(
+                    function_name,
+                    aggregate=aggregate,
+                    class_name=class_name,
+                    constant_name=constant_name,
+                    return_type=identifiers[function_name][0][2],
+                )
+            )
+            continue
+        lines.append(
+            _render_signature_constant(
+                constant_name,
+                identifiers[function_name],
+                function_type=function_type,
+                constants=constants,
+            )
+        )
         lines.append(
             _render_method(
                 function_name,
@@ -590,7 +932,6 @@ def _render_namespace(
                 registered_names=(function_name,),
             )
         )
-        identifier_registry[function_name] = function_name
         if function_type == "aggregate":
             filter_name = f"{function_name}_filter"
             lines.append(
@@ -605,11 +946,17 @@ def _render_namespace(
                     registered_names=(filter_name,),
                 )
             )
-            identifier_registry[filter_name] = filter_name
     for symbol_name in sorted(symbols):
         constant_name = _signature_constant_name(symbol_name)
         method_name = _symbol_method_name(symbol_name)
-        lines.append(_render_signature_constant(constant_name, symbols[symbol_name]))
+        lines.append(
+            _render_signature_constant(
+                constant_name,
+                symbols[symbol_name],
+                function_type=function_type,
+                constants=constants,
+            )
+        )
         lines.append(
             _render_method(
                 method_name,
@@ -621,23 +968,6 @@ def _render_namespace(
                 registered_names=(),
             )
         )
-        symbol_registry[symbol_name] = method_name
-    if identifier_registry:
-        lines.append("")
-        lines.append("    _IDENTIFIER_FUNCTIONS: ClassVar[dict[str, str]] = {")
-        for alias, method_name in identifier_registry.items():
-            lines.append(f"        {alias!r}: {method_name!r},")
-        lines.append("    }")
-    else:
-        lines.append("    _IDENTIFIER_FUNCTIONS: ClassVar[dict[str, str]] = {}")
-    if symbol_registry:
-        lines.append("")
-        lines.append("    _SYMBOLIC_FUNCTIONS: ClassVar[dict[str, str]] = {")
-        for alias, method_name in symbol_registry.items():
-            lines.append(f"        {alias!r}: {method_name!r},")
-        lines.append("    }")
-    else:
-        lines.append("    _SYMBOLIC_FUNCTIONS: ClassVar[dict[str, str]] = {}")
     return "\n".join(lines)
 
 
@@ -685,39 +1015,28 @@ def _render_stub_namespace(
         lines.append("    ...")
         return "\n".join(lines)
     for function_name in sorted(identifiers):
+        signature, _ = _method_parameters(
+            identifiers[function_name],
+            function_type=function_type,
+            default="...",
+        )
+        lines.append(f"    def {function_name}(self{signature}) -> {expression}: ...")
         if function_type == "aggregate":
-            extra = (
-                "order_by: Iterable[object] | object | None = ..., "
-                "within_group: Iterable[object] | object | None = ..., "
-                "partition_by: Iterable[object] | object | None = ..., "
-                "over_order_by: Iterable[object] | object | None = ..., "
-                "frame: str | None = ..."
-            )
-            signature = "".join(extra)
-            lines.append(
-                f"    def {function_name}(self, *operands: object, {signature}) -> {expression}: ..."
-            )
-            lines.append(
-                f"    def {function_name}_filter(self, predicate: object, *operands: object, {signature}) -> {expression}: ..."
+            signature, _ = _method_parameters(
+                identifiers[function_name],
+                function_type=function_type,
+                filter_variant=True,
+                default="...",
             )
-        else:
-            lines.append(f"    def {function_name}(self, *operands: object) -> {expression}: ...")
+            lines.append(f"    def {function_name}_filter(self{signature}) -> {expression}: ...")
     for symbol_name in sorted(symbols):
         method_name = _symbol_method_name(symbol_name)
-        if function_type == "aggregate":
-            extra = (
-                "order_by: Iterable[object] | object | None = ..., "
-                "within_group: Iterable[object] | object | None = ..., "
-                "partition_by: Iterable[object] | object | None = ..., "
-                "over_order_by: Iterable[object] | object | None = ..., "
-                "frame: str | None = ..."
-            )
-            signature = "".join(extra)
-            lines.append(
-                f"    def {method_name}(self, *operands: object, {signature}) -> {expression}: ..."
-            )
-        else:
-            lines.append(f"    def {method_name}(self, *operands: object) -> {expression}: ...")
+        signature, _ = _method_parameters(
+            symbols[symbol_name],
+            function_type=function_type,
+            default="...",
+        )
+        lines.append(f"    def {method_name}(self{signature}) -> {expression}: ...")
     return "\n".join(lines)
 
 
@@ -796,6 +1115,10 @@ def _render_catalog_markdown(
 
 def main() -> None:
     index = _load_definitions()
+    constants = _GeneratedConstants(
+        parameters=_parameter_constant_names(index),
+        types=_type_constant_names(index),
+    )
     for function_type in ("aggregate", "scalar", "window"):
         type_bucket = index.setdefault(function_type, {})
         for category in ("blob", "boolean", "generic", "numeric", "varchar"):
@@ -813,13 +1136,19 @@ def main() -> None:
         "from .functions import (",
         "    DuckDBFunctionDefinition,",
         "    DuckDBFunctionSignature,",
+        "    _LazySignatures,",
         "    _StaticFunctionNamespace,",
+        "    _list_aggregate_method,",
         "    duckdb_function,",
         "    call_duckdb_filter_function,",
         "    call_duckdb_function,",
         ")",
         "from .types import parse_type",
         "",
+        *_render_type_constants(constants.types),
+        "",
+        *_render_parameter_constants(constants.parameters, type_constants=constants.types),
+        "",
         "",
     ]
     stub_lines: list[str] = [
@@ -899,6 +1228,7 @@ def main() -> None:
                     category=category,
                     identifiers=identifiers,
                     symbols=symbols,
+                    constants=constants,
                 )
             )
             output_lines.append("")
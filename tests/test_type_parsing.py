@@ -29,3 +29,9 @@ def test_struct_type_preserves_fields() -> None:
         StructField("id", parse_type("INTEGER")),
         StructField("name", parse_type("VARCHAR")),
     )
+
+
+def test_parse_type_reuses_parsed_instances() -> None:
+    duck_type = parse_type("TIMESTAMP WITH TIME ZONE")
+    assert parse_type("TIMESTAMP WITH TIME ZONE") is duck_type
+    assert parse_type(None) is None
@@ -70,6 +70,32 @@ def test_ducktype_module_re_exports_namespace() -> None:
     assert ducktype is expression_ducktype
 
 
+def test_ducktype_namespaces_share_class_level_factories() -> None:
+    namespace = DuckTypeNamespace()
+
+    assert not hasattr(namespace, "__dict__")
+    assert namespace.Numeric is DuckTypeNamespace.Numeric
+    assert namespace.Timestamp_tz is expression_ducktype.Timestamp_tz
+
+
+def test_ducktype_factories_do_not_allocate_instance_dicts() -> None:
+    factories = (
+        ducktype.Numeric,
+        ducktype.Numeric.Aggregate,
+        ducktype.Varchar,
+        ducktype.Boolean,
+        ducktype.Blob,
+        ducktype.Generic,
+        ducktype.Generic.Aggregate,
+        ducktype.Timestamp,
+        ducktype.Timestamp.Aggregate,
+        ducktype.Decimal_10_2,
+    )
+
+    for factory in factories:
+        assert not hasattr(factory, "__dict__")
+
+
 def test_ducktype_module_factory_aliases_are_identical() -> None:
     assert Numeric is expression_ducktype.Numeric
     assert Varchar is expression_ducktype.Varchar
@@ -1,5 +1,6 @@
 """Unit tests for the typed expression sub-module."""
 
+from collections.abc import Callable
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -15,6 +16,8 @@ from duckplus.static_typed import (
     SCALAR_FUNCTIONS,
     ducktype,
 )
+from duckplus.static_typed.dependencies import column_dependencies, normalise_dependencies
+from duckplus.static_typed.expressions.utils import format_numeric, quote_identifier
 def col_dep(name: str, *, table: str | None = None) -> ExpressionDependency:
     return ExpressionDependency.column(name, table=table)
 
@@ -354,6 +357,82 @@ def test_timestamp_with_timezone_literal_tracks_type() -> None:
     assert literal.duck_type.render() == "TIMESTAMP WITH TIME ZONE"
 
 
+@pytest.mark.parametrize(
+    "factory",
+    [
+        ducktype.Tinyint,
+        ducktype.Integer,
+        ducktype.Uinteger,
+        ducktype.Double,
+        ducktype.Date,
+        ducktype.Timestamp_ms,
+        ducktype.Timestamp_tz,
+    ],
+)
+def test_concrete_expressions_do_not_allocate_instance_dicts(
+    factory: Callable[[str], object],
+) -> None:
+    expression = factory("value")
+    assert not hasattr(expression, "__dict__")
+
+
+def test_normalise_dependencies_passes_through_normalised_sets() -> None:
+    normalised = frozenset({col_dep("total"), col_dep("amount", table="orders")})
+
+    assert normalise_dependencies(normalised) is normalised
+    assert normalise_dependencies(frozenset({"total"})) == {col_dep("total")}
+
+
+def test_dependency_free_expressions_share_the_empty_set() -> None:
+    numeric = ducktype.Numeric.literal(5)
+    varchar = ducktype.Varchar.literal("x")
+
+    assert numeric.dependencies == frozenset()
+    assert numeric.dependencies is varchar.dependencies
+    assert normalise_dependencies(iter(())) is numeric.dependencies
+
+
+def test_column_references_share_dependency_sets() -> None:
+    first = ducktype.Integer("price")
+    second = ducktype.Varchar("price")
+
+    assert first.dependencies == {ExpressionDependency.column("price")}
+    assert first.dependencies is second.dependencies
+    assert ducktype.Numeric("price", table="orders").dependencies is column_dependencies(
+        "price", table="orders"
+    )
+
+
+def test_aliased_expressions_reuse_base_metadata() -> None:
+    base = ducktype.Integer("amount") + 1
+    aliased = base.alias("total")
+
+    assert aliased.render() == '("amount" + 1) AS "total"'
+    assert aliased.duck_type is base.duck_type
+    assert aliased.dependencies is base.dependencies
+
+
+def test_default_typed_expressions_share_type_metadata() -> None:
+    left = ducktype.Boolean("a") & ducktype.Boolean("b")
+    right = ducktype.Boolean.literal(True)
+
+    assert left.duck_type is right.duck_type
+    assert ducktype.Varchar("a").duck_type is ducktype.Varchar.literal("x").duck_type
+    assert ducktype.Generic("a").duck_type is ducktype.Generic.null().duck_type
+
+
+def test_quote_identifier_reuses_escaped_names() -> None:
+    quoted = quote_identifier('odd"name')
+
+    assert quoted == '"odd""name"'
+    assert quote_identifier('odd"name') is quoted
+
+
+@pytest.mark.parametrize("value", [-17, -16, -1, 0, 1, 256, 257, 10**20])
+def test_format_numeric_renders_integers_like_repr(value: int) -> None:
+    assert format_numeric(value) == repr(value)
+
+
 def test_date_coalesce_tracks_dependencies() -> None:
     fallback = ducktype.Date.literal("2024-01-01")
     expression = ducktype.Date("order_date").coalesce(fallback)
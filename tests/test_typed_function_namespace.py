@@ -22,10 +22,13 @@ from duckplus.static_typed._generated_function_namespaces import (
     ScalarGenericFunctions,
     ScalarVarcharFunctions,
 )
+from duckplus.static_typed import functions as functions_module
 from duckplus.static_typed.functions import (
+    DuckDBFunctionDefinition,
     _StaticFunctionNamespace,
     duckdb_function,
 )
+from duckplus.static_typed.types import parse_type
 
 
 class _LegacyNamespace(_StaticFunctionNamespace[GenericExpression]):
@@ -70,6 +73,30 @@ def test_static_namespace_preserves_legacy_mappings() -> None:
     assert namespace._SYMBOLIC_FUNCTIONS["!!"] == "modern_symbol"
 
 
+def test_duckdb_function_decorator_collapses_repeated_aliases() -> None:
+    @duckdb_function("alias", "alias", "other", symbols=["!!", "!!"])
+    def helper(self: object) -> str:  # pragma: no cover - metadata only
+        return "helper"
+
+    @duckdb_function()
+    def fallback(self: object) -> str:  # pragma: no cover - metadata only
+        return "fallback"
+
+    assert getattr(helper, "__duckdb_identifiers__") == ("alias", "other")
+    assert getattr(helper, "__duckdb_symbols__") == ("!!",)
+    assert getattr(fallback, "__duckdb_identifiers__") == ("fallback",)
+    assert getattr(fallback, "__duckdb_symbols__") == ()
+
+
+def test_generated_namespaces_resolve_registered_names() -> None:
+    namespace = ScalarVarcharFunctions()
+
+    assert namespace._IDENTIFIER_FUNCTIONS["lower"] == "lower"
+    assert namespace.get("lower") is not None
+    # Dunder-prefixed DuckDB internals are name-mangled inside the class body.
+    assert namespace.get("__internal_decompress_string") is not None
+
+
 def test_decimal_factories_expose_metadata_at_import_time() -> None:
     module = importlib.reload(decimal_module)
 
@@ -89,6 +116,15 @@ def test_decimal_factories_expose_metadata_at_import_time() -> None:
     assert namespace_factory.expression_type.default_type().render() == "DECIMAL(10, 2)"
 
 
+def test_decimal_factories_share_precomputed_type_metadata() -> None:
+    expression_type = decimal_module.Decimal_12_4.expression_type
+
+    assert expression_type.__name__ == "Decimal12_4Expression"
+    assert expression_type.default_type() is expression_type.default_type()
+    assert expression_type.default_literal_type(Decimal("1.5")) is expression_type.default_type()
+    assert not hasattr(expression_type("amount"), "__dict__")
+
+
 def test_decimal_registration_rejects_duplicate_factories(monkeypatch: pytest.MonkeyPatch) -> None:
     duplicate_items = (
         ("Decimal_1_0", decimal_module.Decimal_1_0),
@@ -529,6 +565,119 @@ def test_generic_array_macros_are_module_scoped() -> None:
     assert array_pop_front_doc and "Drop the first element" in array_pop_front_doc
 
 
+def test_generic_list_aggregate_macros_share_factory() -> None:
+    namespace = ScalarGenericFunctions()
+
+    list_min_method = type(namespace).__dict__["list_min"]
+    assert list_min_method.__module__ == (
+        "duckplus.static_typed._generated_function_namespaces"
+    )
+    assert list_min_method.__qualname__ == "ScalarGenericFunctions.list_min"
+    assert inspect.getdoc(list_min_method) == (
+        "Call DuckDB function ``list_min``.\n\n"
+        "Overloads:\n"
+        '- main.list_min(ANY l) -> "NULL"'
+    )
+    assert namespace.get("list_min") is not None
+
+    (signature,) = ScalarGenericFunctions._LIST_SUM_SIGNATURES
+    assert signature.macro_definition == "list_aggr(l, 'sum')"
+
+    expression = namespace.list_sum(("orders", "amounts"))
+    assert expression.render() == 'list_sum("orders"."amounts")'
+    assert expression.dependencies == {
+        ExpressionDependency.column("amounts", table="orders")
+    }
+
+
+def test_function_dispatch_plans_are_cached_per_signature_tuple() -> None:
+    signatures = ScalarGenericFunctions._LIST_SUM_SIGNATURES
+    plan = functions_module._dispatch_plan(signatures)
+
+    assert functions_module._dispatch_plan(signatures) is plan
+    assert functions_module._dispatch_plan(list(signatures)) is not plan
+    assert functions_module._select_signature(signatures, ("amounts",)) is signatures[0]
+    with pytest.raises(TypeError, match="No DuckDB overload found for list_sum"):
+        functions_module._select_signature(signatures, ("amounts", "prices"))
+
+
+def test_function_dispatch_plans_bucket_overloads_by_arity() -> None:
+    varchar = parse_type("VARCHAR")
+    unary = DuckDBFunctionDefinition("main", "concat", "scalar", varchar, (varchar,), ("value",))
+    variadic = DuckDBFunctionDefinition(
+        "main", "concat", "scalar", varchar, (varchar,), ("value",), varargs=varchar
+    )
+    plan = functions_module._dispatch_plan((unary, variadic))
+
+    assert plan.select(("a",)) is unary
+    assert plan.select(("a", "b", "c")) is variadic
+    with pytest.raises(TypeError, match="No DuckDB overload found for concat"):
+        plan.select(())
+
+
+def test_function_dispatch_plans_reuse_selection_for_operand_types() -> None:
+    integer = parse_type("INTEGER")
+    varchar = parse_type("VARCHAR")
+    numeric = DuckDBFunctionDefinition("main", "f", "scalar", integer, (integer,), ("value",))
+    text = DuckDBFunctionDefinition("main", "f", "scalar", varchar, (varchar,), ("value",))
+    plan = functions_module._dispatch_plan((numeric, text))
+    namespace = DuckTypeNamespace()
+
+    assert plan.select((namespace.Varchar("a"),)) is text
+    assert plan.select((namespace.Integer("a"),)) is numeric
+    assert plan.select((namespace.Varchar("b"),)) is text
+    assert plan.select((namespace.Integer("b"),)) is numeric
+
+
+def test_nullary_function_calls_share_one_expression() -> None:
+    expression = ScalarVarcharFunctions().current_role()
+
+    assert expression.render() == "current_role()"
+    assert expression.dependencies == frozenset()
+    assert ScalarVarcharFunctions().current_role() is expression
+
+    aggregate = AggregateNumericFunctions()
+    shared = aggregate.count_star()
+    ordered = aggregate.count_star(order_by="id")
+
+    assert AggregateNumericFunctions().count_star() is shared
+    assert ordered is not shared
+    assert ordered.render() == 'count_star(ORDER BY "id")'
+
+
+def test_function_namespaces_do_not_allocate_instance_dicts() -> None:
+    namespace = ScalarGenericFunctions()
+
+    assert not hasattr(namespace, "__dict__")
+    assert namespace.return_category == "generic"
+
+
+def test_lazy_signatures_materialise_once_on_the_defining_class() -> None:
+    calls: list[int] = []
+
+    def build() -> tuple[functions_module.DuckDBFunctionDefinition, ...]:
+        calls.append(1)
+        return ScalarGenericFunctions._LIST_SUM_SIGNATURES
+
+    class _Namespace:
+        _SIGNATURES = functions_module._LazySignatures(build)
+
+    class _Child(_Namespace):
+        pass
+
+    assert _Child._SIGNATURES is _Namespace._SIGNATURES
+    assert calls == [1]
+    assert isinstance(_Namespace.__dict__["_SIGNATURES"], tuple)
+
+
+def test_generated_signatures_materialise_on_first_access() -> None:
+    signatures = ScalarVarcharFunctions._LPAD_SIGNATURES
+
+    assert ScalarVarcharFunctions.__dict__["_LPAD_SIGNATURES"] is signatures
+    assert [signature.function_name for signature in signatures] == ["lpad"]
+    assert signatures[0].function_type == "scalar"
+
+
 def test_numeric_summation_helpers_are_module_scoped() -> None:
     namespace = AggregateNumericFunctions()
 